@@ -19,11 +19,10 @@ LOG_DIR = Path("logs")
 def read_latest_log():
     """Read the latest log file"""
     try:
-        log_files = list(LOG_DIR.glob("bot_*.log"))
-        if not log_files:
+        latest_log = LOG_DIR / "bot.log"
+        if not latest_log.exists():
             return []
 
-        latest_log = max(log_files, key=os.path.getmtime)
         with open(latest_log, 'r') as f:
             lines = f.readlines()
             return lines[-100:]  # Last 100 lines
@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.main import ArbitrageBot
 from src.arbitrage.hyperliquid_executor import ExecutionStrategy
 from src.utils.logger import setup_logging, console
+from src.utils.event_loop import install_uvloop
 from src.config import config
 
 
@@ -148,4 +149,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -99,11 +99,11 @@ class HyperliquidArbitrageDetector:
             except Exception as e:
                 bot_logger.error(f"Error scanning {asset}: {e}")
         
-        # Sort by expected profit adjusted for risk
-        opportunities.sort(
-            key=lambda x: x.expected_profit_usd * x.probability_of_profit,
-            reverse=True
-        )
+        # Sort by expected profit adjusted for risk (stable, so ties keep scan order)
+        if len(opportunities) > 1:
+            soa = ArbitrageOpportunity.to_soa(opportunities)
+            order = np.argsort(-(soa["profit"] * soa["prob"]), kind="stable")
+            opportunities = [opportunities[i] for i in order]
         
         self.last_opportunities = opportunities
         
@@ -562,9 +562,17 @@ class HyperliquidArbitrageDetector:
             if opportunity.expires_at <= datetime.utcnow():
                 return False, ["Market has expired"]
             
-            # Re-fetch current prices
-            current_hl = await self.hyperliquid.get_market_data(
-                opportunity.polymarket.asset
+            # Re-fetch prices, books and balances concurrently
+            asset = opportunity.polymarket.asset
+            current_hl, pm_book, hl_book, pm_balance, hl_balance = await asyncio.gather(
+                self.hyperliquid.get_market_data(asset),
+                self.polymarket.get_order_book(
+                    opportunity.polymarket.market_id,
+                    opportunity.polymarket_side.value
+                ),
+                self.hyperliquid.get_order_book(asset),
+                self.polymarket.get_balance(),
+                self.hyperliquid.get_balance()
             )
             
             if not current_hl:
@@ -583,11 +591,6 @@ class HyperliquidArbitrageDetector:
                 warnings.append(f"High funding rate: {current_funding:.4%}")
             
             # Check Polymarket liquidity
-            pm_book = await self.polymarket.get_order_book(
-                opportunity.polymarket.market_id,
-                opportunity.polymarket_side.value
-            )
-            
             available_liquidity = sum(
                 level.quantity for level in 
                 (pm_book["asks"] if opportunity.polymarket_side == MarketSide.UP else pm_book["bids"])
@@ -597,10 +600,6 @@ class HyperliquidArbitrageDetector:
                 warnings.append(f"Reduced Polymarket liquidity: {available_liquidity:.0f}")
             
             # Check Hyperliquid order book
-            hl_book = await self.hyperliquid.get_order_book(
-                opportunity.polymarket.asset
-            )
-            
             hl_liquidity = sum(
                 level.quantity for level in
                 (hl_book["asks"] if opportunity.hedge_side == MarketSide.LONG else hl_book["bids"])[:5]
@@ -610,9 +609,6 @@ class HyperliquidArbitrageDetector:
                 warnings.append(f"Insufficient Hyperliquid liquidity: {hl_liquidity:.4f}")
             
             # Check account balances
-            pm_balance = await self.polymarket.get_balance()
-            hl_balance = await self.hyperliquid.get_balance()
-            
             required_pm = opportunity.polymarket_quantity * opportunity.polymarket_price
             required_hl = opportunity.hedge_quantity * opportunity.hedge_price / config.DEFAULT_LEVERAGE
             
@@ -2,11 +2,13 @@
 Hyperliquid execution engine for managing arbitrage positions
 """
 import asyncio
+import time
 import uuid
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
 from enum import Enum
+import numpy as np
 
 from src.models import (
     ArbitrageOpportunity,
@@ -55,16 +57,31 @@ class HyperliquidExecutor:
         self.active_positions: Dict[str, Position] = {}
         self.position_history: List[Position] = []
         
+        # Set whenever a position is moved to position_history
+        self.position_closed = asyncio.Event()
+        
         # Risk limits
         self.max_concurrent = config.MAX_CONCURRENT_POSITIONS
         self.max_daily_trades = config.MAX_DAILY_TRADES
         self.daily_trade_count = 0
         self.last_trade_reset = datetime.utcnow().date()
+        self._position_counter = 0
+        
+        # Executions that passed the pre-trade checks but are not stored yet,
+        # keyed by opportunity ID as (asset, hedge notional, Polymarket cost,
+        # Hyperliquid margin); counted against the limits so concurrent
+        # executions cannot all pass them before any position is stored
+        self._reservations: Dict[str, Tuple[str, Decimal, Decimal, Decimal]] = {}
+        self._reservation_lock = asyncio.Lock()
         
         # Execution metrics
         self.execution_times: List[float] = []
         self.slippage_history: List[Decimal] = []
         
+        # Float mirrors of slippage / closed P&L for cheap aggregate stats
+        self._slippage_floats: List[float] = []
+        self._pnl_floats: List[float] = []
+        
         bot_logger.info(f"Initialized Hyperliquid executor with {strategy} strategy")
     
     async def execute_opportunity(
@@ -82,13 +99,55 @@ class HyperliquidExecutor:
         """
         start_time = datetime.utcnow()
         
-        # Pre-execution checks
-        if not await self._pre_execution_checks(opportunity):
+        # Pre-execution checks; reserves a slot until execution finishes
+        if not await self._reserve(opportunity):
             return None
         
+        try:
+            return await self._open_position(opportunity, start_time)
+        finally:
+            self._reservations.pop(opportunity.opportunity_id, None)
+    
+    async def _reserve(self, opportunity: ArbitrageOpportunity) -> bool:
+        """
+        Run the pre-execution checks and reserve a slot for the opportunity
+        
+        Checks and reservation happen under one lock, so each concurrent
+        execution sees the others' claims on the position, daily trade,
+        exposure and balance limits.
+        
+        Args:
+            opportunity: Opportunity about to be executed
+        
+        Returns:
+            True if reserved; the caller releases the reservation when done
+        """
+        async with self._reservation_lock:
+            if opportunity.opportunity_id in self._reservations:
+                bot_logger.warning(f"Opportunity {opportunity.opportunity_id[:8]} is already executing")
+                return False
+            
+            if not await self._pre_execution_checks(opportunity):
+                return False
+            
+            hedge_notional = opportunity.hedge_quantity * opportunity.hedge_price
+            self._reservations[opportunity.opportunity_id] = (
+                opportunity.polymarket.asset,
+                hedge_notional,
+                opportunity.polymarket_quantity * opportunity.polymarket_price,
+                hedge_notional / config.DEFAULT_LEVERAGE
+            )
+            return True
+    
+    async def _open_position(
+        self,
+        opportunity: ArbitrageOpportunity,
+        start_time: datetime
+    ) -> Optional[Position]:
+        """Execute both legs of a reserved opportunity and store the position"""
         # Create position object
         position = Position(
-            position_id=str(uuid.uuid4()),
+            position_id=self._next_position_id(),
             opportunity_id=opportunity.opportunity_id,
             polymarket_side=opportunity.polymarket_side,
             hedge_exchange="hyperliquid",
@@ -131,9 +190,10 @@ class HyperliquidExecutor:
             # Calculate and log slippage
             slippage = self._calculate_slippage(position, opportunity)
             self.slippage_history.append(slippage)
+            self._slippage_floats.append(float(slippage))
             
             bot_logger.info(
-                f"✅ Position opened {position.position_id[:8]} - "
+                f"✅ Position opened {position.short_id} - "
                 f"PM: {position.polymarket_quantity:.2f} @ {position.polymarket_entry_price:.4f}, "
                 f"HL: {position.hedge_quantity:.4f} @ ${position.hedge_entry_price:.2f} "
                 f"(Execution: {execution_time:.1f}s, Slippage: {slippage:.2%})",
@@ -147,6 +207,13 @@ class HyperliquidExecutor:
             await self._rollback_position(position)
             return None
     
+    def _next_position_id(self) -> str:
+        """Generate a process-unique position ID without hitting os.urandom"""
+        if config.UUID_POSITION_IDS:
+            return str(uuid.uuid4())
+        self._position_counter += 1
+        return f"{time.time_ns():x}{self._position_counter:04x}"
+    
     async def _pre_execution_checks(self, opportunity: ArbitrageOpportunity) -> bool:
         """Perform pre-execution risk and sanity checks"""
         # Check risk limits
@@ -165,17 +232,47 @@ class HyperliquidExecutor:
             bot_logger.warning(f"Extreme funding rate: {funding_rate:.4%}")
             return False
         
-        # Check position concentration
+        # Check position concentration, including executions still in flight
+        asset = opportunity.polymarket.asset
         existing_exposure = sum(
             p.hedge_quantity * p.hedge_entry_price 
             for p in self.active_positions.values()
-            if p.hedge_symbol.startswith(opportunity.polymarket.asset)
+            if p.hedge_symbol.startswith(asset)
+        ) + sum(
+            notional for pending_asset, notional, _, _ in self._reservations.values()
+            if pending_asset == asset
         )
         
         if existing_exposure > config.MAX_POSITION_SIZE_USD * Decimal("2"):
-            bot_logger.warning(f"Position concentration limit reached for {opportunity.polymarket.asset}")
+            bot_logger.warning(f"Position concentration limit reached for {asset}")
             return False
         
+        # Validation saw the balances without the capital claimed by
+        # in-flight executions, so re-check net of their reservations
+        if self._reservations:
+            pm_balance, hl_balance = await asyncio.gather(
+                self.polymarket.get_balance(),
+                self.hyperliquid.get_balance()
+            )
+            reserved_pm = sum(r[2] for r in self._reservations.values())
+            reserved_hl = sum(r[3] for r in self._reservations.values())
+            required_pm = opportunity.polymarket_quantity * opportunity.polymarket_price
+            required_hl = opportunity.hedge_quantity * opportunity.hedge_price / config.DEFAULT_LEVERAGE
+            
+            if pm_balance - reserved_pm < required_pm:
+                bot_logger.warning(
+                    f"Insufficient Polymarket balance after reservations: "
+                    f"${pm_balance:.2f} - ${reserved_pm:.2f} reserved"
+                )
+                return False
+            
+            if hl_balance - reserved_hl < required_hl:
+                bot_logger.warning(
+                    f"Insufficient Hyperliquid balance after reservations: "
+                    f"${hl_balance:.2f} - ${reserved_hl:.2f} reserved"
+                )
+                return False
+        
         return True
     
     def _create_execution_plan(self, opportunity: ArbitrageOpportunity) -> Dict[str, Any]:
@@ -228,28 +325,20 @@ class HyperliquidExecutor:
                 exec_plan["leverage"]
             )
             
-            # Create execution tasks
-            pm_task = asyncio.create_task(
-                self._execute_polymarket_leg(opportunity, position, exec_plan)
-            )
-            hl_task = asyncio.create_task(
-                self._execute_hyperliquid_leg(opportunity, position, exec_plan)
-            )
-            
-            # Wait with timeout
-            done, pending = await asyncio.wait(
-                [pm_task, hl_task],
-                timeout=exec_plan["time_limit"],
-                return_when=asyncio.ALL_COMPLETED
-            )
-            
-            # Cancel any pending tasks
-            for task in pending:
-                task.cancel()
-            
-            # Check results
-            pm_success = pm_task.done() and await pm_task
-            hl_success = hl_task.done() and await hl_task
+            # Run both legs concurrently, cancelling both on timeout. Post-only
+            # plans too: the Polymarket leg may poll for its fill for up to
+            # half the time limit, which must not delay placing the hedge
+            try:
+                pm_success, hl_success = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._execute_polymarket_leg(opportunity, position, exec_plan),
+                        self._execute_hyperliquid_leg(opportunity, position, exec_plan)
+                    ),
+                    timeout=exec_plan["time_limit"]
+                )
+            except asyncio.TimeoutError:
+                bot_logger.warning("Parallel execution timed out")
+                return False
             
             return pm_success and hl_success
             
@@ -324,7 +413,7 @@ class HyperliquidExecutor:
             return pm_fill_rate > 0.8 and hl_fill_rate > 0.8
             
         except Exception as e:
-            bot_logger.error(f"TWAP execution failed: {e}")
+            bot_logger.error("TWAP execution failed: %s", e)
             return False
     
     async def _execute_polymarket_leg(
@@ -362,14 +451,13 @@ class HyperliquidExecutor:
             position.polymarket_order_id = order_id
             
             # Wait for fill
-            filled = await self._wait_for_fill(
+            order_status = await self._wait_for_fill(
                 order_id,
                 is_polymarket=True,
                 timeout=exec_plan["time_limit"] // 2
             )
             
-            if filled:
-                order_status = await self.polymarket.get_order_status(order_id)
+            if order_status is not None:
                 position.polymarket_entry_price = Decimal(str(order_status.get("price", 0)))
                 position.polymarket_quantity = Decimal(str(order_status.get("filled", 0)))
                 position.polymarket_fees = Decimal(str(order_status.get("fees", 0)))
@@ -445,6 +533,10 @@ class HyperliquidExecutor:
             # Calculate take profit (closer to breakeven for safety)
             position.take_profit_price = opportunity.breakeven_price * Decimal("0.95")
             
+            # Monitoring compares against floats; Decimals are kept for settlement
+            position.stop_loss_price_f = float(position.stop_loss_price)
+            position.take_profit_price_f = float(position.take_profit_price)
+            
             # Note: Hyperliquid doesn't have native stop/take profit orders
             # These will be monitored and executed by our monitoring system
             
@@ -471,8 +563,13 @@ class HyperliquidExecutor:
         order_id: str,
         is_polymarket: bool,
         timeout: int = 60
-    ) -> bool:
-        """Wait for order fill"""
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for order fill
+        
+        Returns:
+            Final order status once filled (empty for Hyperliquid), None on timeout
+        """
         start = datetime.utcnow()
         
         while (datetime.utcnow() - start).total_seconds() < timeout:
@@ -480,22 +577,22 @@ class HyperliquidExecutor:
                 if is_polymarket:
                     status = await self.polymarket.get_order_status(order_id)
                     if status.get("filled", 0) > 0:
-                        return True
+                        return status
                 else:
                     # For Hyperliquid, check positions
-                    return True  # Hyperliquid executes immediately
+                    return {}  # Hyperliquid executes immediately
                 
                 await asyncio.sleep(1)
                 
             except Exception as e:
-                bot_logger.error(f"Error checking order status: {e}")
+                bot_logger.error("Error checking order status: %s", e)
                 await asyncio.sleep(1)
         
-        return False
+        return None
     
     async def _rollback_position(self, position: Position):
         """Rollback a partially executed position"""
-        bot_logger.warning(f"Rolling back position {position.position_id[:8]}")
+        bot_logger.warning("Rolling back position %s", position.short_id)
         
         try:
             # Close Polymarket position if exists
@@ -528,10 +625,13 @@ class HyperliquidExecutor:
             self.daily_trade_count = 0
             self.last_trade_reset = datetime.utcnow().date()
         
-        if len(self.active_positions) >= self.max_concurrent:
+        # Reserved executions count as positions/trades until they finish
+        pending = len(self._reservations)
+        
+        if len(self.active_positions) + pending >= self.max_concurrent:
             return False
         
-        if self.daily_trade_count >= self.max_daily_trades:
+        if self.daily_trade_count + pending >= self.max_daily_trades:
             return False
         
         return True
@@ -561,22 +661,23 @@ class HyperliquidExecutor:
                         continue
                     
                     current_price = market.mid_price
+                    price = float(current_price)
                     
                     # Calculate P&L
                     if position.hedge_side == MarketSide.LONG:
                         hedge_pnl = position.hedge_quantity * (current_price - position.hedge_entry_price)
                         
                         # Check stop/take profit
-                        if current_price <= position.stop_loss_price:
+                        if price <= position.stop_loss_price_f:
                             await self.close_position(position, reason="Stop loss")
-                        elif current_price >= position.take_profit_price:
+                        elif price >= position.take_profit_price_f:
                             await self.close_position(position, reason="Take profit")
                     else:
                         hedge_pnl = position.hedge_quantity * (position.hedge_entry_price - current_price)
                         
-                        if current_price >= position.stop_loss_price:
+                        if price >= position.stop_loss_price_f:
                             await self.close_position(position, reason="Stop loss")
-                        elif current_price <= position.take_profit_price:
+                        elif price <= position.take_profit_price_f:
                             await self.close_position(position, reason="Take profit")
                     
                     position.unrealized_pnl = hedge_pnl
@@ -584,19 +685,19 @@ class HyperliquidExecutor:
                     # Check funding
                     funding_rate = await self.hyperliquid.get_funding_rate(asset)
                     if abs(funding_rate) > config.FUNDING_RATE_THRESHOLD * 3:
-                        bot_logger.warning(f"High funding rate {funding_rate:.4%} for {position_id[:8]}")
+                        bot_logger.warning("High funding rate %.4f%% for %s", float(funding_rate) * 100, position.short_id)
                         await self.close_position(position, reason="High funding rate")
                 
                 await asyncio.sleep(5)
                 
             except Exception as e:
-                bot_logger.error(f"Position monitoring error: {e}")
+                bot_logger.error("Position monitoring error: %s", e)
                 await asyncio.sleep(10)
     
     async def close_position(self, position: Position, reason: str = "Manual"):
         """Close an active position"""
         try:
-            bot_logger.info(f"Closing position {position.position_id[:8]} - {reason}")
+            bot_logger.info("Closing position %s - %s", position.short_id, reason)
             
             # Close Hyperliquid position
             if position.hedge_quantity > 0:
@@ -611,15 +712,19 @@ class HyperliquidExecutor:
             
             # Move to history
             self.position_history.append(position)
+            self._pnl_floats.append(float(position.net_pnl))
             del self.active_positions[position.position_id]
+            self.position_closed.set()
             
             bot_logger.info(
-                f"Closed {position.position_id[:8]} - P&L: ${position.net_pnl:.2f}",
+                "Closed %s - P&L: $%.2f",
+                position.short_id,
+                float(position.net_pnl),
                 extra={"trade": True}
             )
             
         except Exception as e:
-            bot_logger.error(f"Error closing position: {e}")
+            bot_logger.error("Error closing position: %s", e)
             position.status = PositionStatus.ERROR
     
     def get_execution_stats(self) -> Dict[str, Any]:
@@ -627,10 +732,33 @@ class HyperliquidExecutor:
         if not self.execution_times:
             return {}
         
+        avg_slippage, success_rate, avg_pnl = _summarize_execution(
+            np.asarray(self._pnl_floats, dtype=np.float64),
+            np.asarray(self._slippage_floats, dtype=np.float64)
+        )
+        
         return {
             "avg_execution_time": sum(self.execution_times) / len(self.execution_times),
-            "avg_slippage": sum(self.slippage_history) / len(self.slippage_history) if self.slippage_history else 0,
+            "avg_slippage": avg_slippage,
             "total_positions": len(self.position_history),
             "active_positions": len(self.active_positions),
-            "success_rate": len([p for p in self.position_history if p.net_pnl > 0]) / len(self.position_history) if self.position_history else 0
+            "success_rate": success_rate,
+            "avg_pnl": avg_pnl
         }
+
+
+def _summarize_execution(pnl: np.ndarray, slippage: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Aggregate closed-position P&L and slippage in a single vectorized pass
+    
+    Args:
+        pnl: Net P&L of closed positions
+        slippage: Execution slippage per opened position
+    
+    Returns:
+        Tuple of (avg_slippage, success_rate, avg_pnl)
+    """
+    avg_slippage = float(slippage.mean()) if slippage.size else 0.0
+    if not pnl.size:
+        return avg_slippage, 0.0, 0.0
+    return avg_slippage, float(np.count_nonzero(pnl > 0)) / pnl.size, float(pnl.mean())
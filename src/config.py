@@ -21,12 +21,15 @@ class TradingConfig(BaseSettings):
     POLYMARKET_API_SECRET: str
     POLYMARKET_PRIVATE_KEY: str
     POLYMARKET_CHAIN_ID: int = 137
+    POLYMARKET_MAX_CONCURRENCY: int = Field(default=16, ge=1)  # in-flight REST/CLOB calls
+    POLYMARKET_TAG_IDS: Dict[str, int] = {}  # asset -> Gamma tag_id, JSON in env
     
     # Hyperliquid Configuration
     HYPERLIQUID_PRIVATE_KEY: str
     HYPERLIQUID_API_WALLET: Optional[str] = None
     HYPERLIQUID_IS_MAINNET: bool = True
     HYPERLIQUID_RPC_URL: str = "https://api.hyperliquid.xyz"
+    HYPERLIQUID_WS_COMPRESSION: bool = True  # permessage-deflate on market data
     
     # Web3 Configuration
     POLYGON_RPC_URL: str = "https://polygon-rpc.com/"
@@ -53,6 +56,7 @@ class TradingConfig(BaseSettings):
     MAX_DAILY_TRADES: int = 20
     MAX_CONCURRENT_POSITIONS: int = 5
     MAX_DAILY_LOSS_USD: Decimal = Field(default=Decimal("500"))
+    MAX_INFLIGHT_ORDERS: int = Field(default=8, ge=1)
     
     # Monitoring
     ENABLE_TELEGRAM_ALERTS: bool = False
@@ -62,6 +66,7 @@ class TradingConfig(BaseSettings):
     # Environment
     ENVIRONMENT: str = "development"
     LOG_LEVEL: str = "INFO"
+    UUID_POSITION_IDS: bool = False  # RFC 4122 IDs for external reporting
     
     @validator("MAX_SLIPPAGE_PERCENT", "DEFAULT_STOP_LOSS_PERCENT", "DEFAULT_TAKE_PROFIT_PERCENT")
     def validate_percentages(cls, v):
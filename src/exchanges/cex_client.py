@@ -2,54 +2,140 @@
 CEX client for spot and futures trading
 """
 import asyncio
-from typing import Optional, Dict, Any, List
+import random
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Callable, Awaitable
 from decimal import Decimal
 from datetime import datetime
+import aiohttp
+import numpy as np
 import ccxt.async_support as ccxt
 
+try:
+    import ccxt.pro as ccxtpro
+except ImportError:  # ccxt.pro not installed; order books fall back to REST
+    ccxtpro = None
+
 from src.models import (
     SpotMarket,
     MarketSide,
     OrderType,
-    PriceLevel
+    PriceLevel,
+    OrderBookArrays,
+    OrderBookSnapshot
 )
 from src.config import config
 from src.utils.logger import bot_logger
 
 
+@dataclass(frozen=True, slots=True)
+class ExchangeSpec:
+    """Static trading specifics of a supported exchange"""
+    klass: type
+    futures_suffix: str
+    has_futures: bool
+    maker_fee: Decimal
+    taker_fee: Decimal
+
+
+def _to_decimal(value: Any, _D=Decimal, _str=str) -> Decimal:
+    """Convert a ccxt numeric field to Decimal, skipping values already converted"""
+    return value if type(value) is _D else _D(_str(value))
+
+
+# Enum -> ccxt strings, resolved once at import
+_SIDE_STR = {side: 'buy' if side is MarketSide.LONG else 'sell' for side in MarketSide}
+_TYPE_STR = {kind: 'market' if kind is OrderType.MARKET else 'limit' for kind in OrderType}
+
+
+def _to_book_arrays(bids: List[List[float]], asks: List[List[float]]) -> OrderBookArrays:
+    """Build float64 order book columns from ccxt [price, amount] levels"""
+    return OrderBookArrays(
+        bids_px=np.fromiter((level[0] for level in bids), dtype=np.float64, count=len(bids)),
+        bids_qty=np.fromiter((level[1] for level in bids), dtype=np.float64, count=len(bids)),
+        asks_px=np.fromiter((level[0] for level in asks), dtype=np.float64, count=len(asks)),
+        asks_qty=np.fromiter((level[1] for level in asks), dtype=np.float64, count=len(asks))
+    )
+
+
+@lru_cache(maxsize=256)
+def _liquidation_factor(leverage: int, side: MarketSide) -> Decimal:
+    """Entry-price multiplier at which a leveraged position is liquidated"""
+    # Simplified calculation (actual varies by exchange)
+    # Maintenance margin is typically 0.5% for most exchanges
+    maintenance_margin = Decimal("0.005")
+    
+    if side == MarketSide.LONG:
+        # Long liquidation: price drops by (100 - maintenance_margin) / leverage %
+        return 1 - (1 - maintenance_margin) / leverage
+    # Short liquidation: price rises by (100 - maintenance_margin) / leverage %
+    return 1 + (1 - maintenance_margin) / leverage
+
+
+async def _with_backoff(
+    call: Callable[[], Awaitable[Any]],
+    retry_on: Tuple[type, ...],
+    attempts: int = 5
+) -> Any:
+    """Await call(), retrying retry_on errors with jittered exponential backoff"""
+    for attempt in range(attempts):
+        try:
+            return await call()
+        except retry_on:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep((2 ** attempt) * 0.05 + random.random() * 0.02)
+
+
 class ExchangeClient:
-    """Client for interacting with centralized exchanges"""
+    """
+    Client for interacting with centralized exchanges
+    
+    All I/O is async ccxt over aiohttp; entry points install uvloop
+    (see src.utils.event_loop) to cut per-await and socket overhead.
+    """
+    
+    __slots__ = (
+        "exchange_name", "spec", "exchange", "exchange_ws",
+        "has_futures", "futures_suffix", "maker_fee", "taker_fee",
+        "session", "markets", "_markets_lock",
+        "_symbol_cache", "_size_factors", "_book_cache", "_book_tasks",
+        "_order_sem", "_params_cache",
+        "quote_max_age", "_quotes", "_refresh_tasks", "book_max_age"
+    )
     
     # Supported exchanges and their specifics
-    EXCHANGE_CONFIG = {
-        "binance": {
-            "class": ccxt.binance,
-            "futures_suffix": "USDT",
-            "has_futures": True,
-            "maker_fee": Decimal("0.0002"),  # 0.02%
-            "taker_fee": Decimal("0.0004")   # 0.04%
-        },
-        "bybit": {
-            "class": ccxt.bybit,
-            "futures_suffix": "USDT",
-            "has_futures": True,
-            "maker_fee": Decimal("0.0001"),
-            "taker_fee": Decimal("0.0006")
-        },
-        # "dydx": {  # Removed from CCXT
-        #     "class": ccxt.dydx,
-        #     "futures_suffix": "-USD",
-        #     "has_futures": True,
-        #     "maker_fee": Decimal("0"),
-        #     "taker_fee": Decimal("0.0005")
-        # },
-        "okx": {
-            "class": ccxt.okx,
-            "futures_suffix": "-USDT-SWAP",
-            "has_futures": True,
-            "maker_fee": Decimal("0.0002"),
-            "taker_fee": Decimal("0.0005")
-        }
+    EXCHANGE_CONFIG: Dict[str, ExchangeSpec] = {
+        "binance": ExchangeSpec(
+            klass=ccxt.binance,
+            futures_suffix="USDT",
+            has_futures=True,
+            maker_fee=Decimal("0.0002"),  # 0.02%
+            taker_fee=Decimal("0.0004")   # 0.04%
+        ),
+        "bybit": ExchangeSpec(
+            klass=ccxt.bybit,
+            futures_suffix="USDT",
+            has_futures=True,
+            maker_fee=Decimal("0.0001"),
+            taker_fee=Decimal("0.0006")
+        ),
+        # "dydx": ExchangeSpec(  # Removed from CCXT
+        #     klass=ccxt.dydx,
+        #     futures_suffix="-USD",
+        #     has_futures=True,
+        #     maker_fee=Decimal("0"),
+        #     taker_fee=Decimal("0.0005")
+        # ),
+        "okx": ExchangeSpec(
+            klass=ccxt.okx,
+            futures_suffix="-USDT-SWAP",
+            has_futures=True,
+            maker_fee=Decimal("0.0002"),
+            taker_fee=Decimal("0.0005")
+        )
     }
     
     def __init__(self, exchange_name: Optional[str] = None):
@@ -64,37 +150,112 @@ class ExchangeClient:
         if self.exchange_name not in self.EXCHANGE_CONFIG:
             raise ValueError(f"Unsupported exchange: {self.exchange_name}")
         
-        exchange_config = self.EXCHANGE_CONFIG[self.exchange_name]
-        ExchangeClass = exchange_config["class"]
+        self.spec = self.EXCHANGE_CONFIG[self.exchange_name]
         
         # Initialize exchange
-        self.exchange = ExchangeClass({
+        exchange_options = {
             'apiKey': config.EXCHANGE_API_KEY,
             'secret': config.EXCHANGE_API_SECRET,
             'enableRateLimit': True,
             'options': {
-                'defaultType': 'future' if exchange_config["has_futures"] else 'spot'
+                'defaultType': 'future' if self.spec.has_futures else 'spot'
             }
-        })
+        }
+        self.exchange = self.spec.klass(exchange_options)
+        
+        # WebSocket exchange for streamed order books (ccxt.pro)
+        ws_class = getattr(ccxtpro, self.exchange_name, None) if ccxtpro else None
+        self.exchange_ws = ws_class(exchange_options) if ws_class else None
+        
+        self.has_futures = self.spec.has_futures
+        self.futures_suffix = self.spec.futures_suffix
+        self.maker_fee = self.spec.maker_fee
+        self.taker_fee = self.spec.taker_fee
+        
+        # Keep-alive headers so the pooled session reuses TLS connections
+        self.exchange.headers = {
+            'Connection': 'keep-alive',
+            'Keep-Alive': 'timeout=60, max=1000'
+        }
+        self.session: Optional[aiohttp.ClientSession] = None
+        
+        # (asset, use_futures) -> exchange symbol
+        self._symbol_cache: Dict[Tuple[str, bool], str] = {}
         
-        self.has_futures = exchange_config["has_futures"]
-        self.futures_suffix = exchange_config["futures_suffix"]
-        self.maker_fee = exchange_config["maker_fee"]
-        self.taker_fee = exchange_config["taker_fee"]
+        # leverage -> (1 - taker_fee) * leverage, for position sizing
+        self._size_factors: Dict[int, Decimal] = {}
+        
+        # symbol -> (monotonic receive time, latest streamed order book),
+        # kept fresh by _book_tasks and dropped when its stream ends
+        self._book_cache: Dict[str, Tuple[float, OrderBookArrays]] = {}
+        self.book_max_age = 2.0  # seconds before a streamed book falls back to REST
+        self._book_tasks: List[asyncio.Task] = []
+        
+        # create_order params keyed by (futures, reduce_only); ccxt doesn't mutate them
+        self._params_cache: Dict[Tuple[bool, bool], Dict[str, Any]] = {
+            (True, True): {'reduceOnly': True},
+            (True, False): {'reduceOnly': False},
+            (False, True): {},
+            (False, False): {}
+        }
+        
+        # (asset, use_futures) -> (monotonic fetch time, quote), kept fresh by subscribe()
+        self._quotes: Dict[Tuple[str, bool], Tuple[float, SpotMarket]] = {}
+        self._refresh_tasks: Dict[Tuple[str, bool], asyncio.Task] = {}
+        self.quote_max_age = 2.0  # seconds before a cached quote falls back to REST; spans one 1 s poll
+        
+        # Caps in-flight order traffic so bursts don't trip the rate limiter
+        self._order_sem = asyncio.Semaphore(config.MAX_INFLIGHT_ORDERS)
+        
+        # Exchange market metadata, loaded once by prime()
+        self.markets: Optional[Dict[str, Any]] = None
+        self._markets_lock = asyncio.Lock()
         
         bot_logger.info(f"Initialized {self.exchange_name} client")
     
     async def __aenter__(self):
         """Async context manager entry"""
+        # Persistent pooled session shared by every ccxt request
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=30,
+            keepalive_timeout=90,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(connector=connector, trust_env=True)
+        self.exchange.session = self.session
+        await self.prime()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self.close()
     
+    async def prime(self):
+        """Load exchange markets once so the first order doesn't pay for it"""
+        if self.markets is not None:
+            return
+        
+        async with self._markets_lock:
+            if self.markets is None:
+                self.markets = await self.exchange.load_markets()
+    
     async def close(self):
         """Close exchange connection"""
+        for task in self._book_tasks:
+            task.cancel()
+        self._book_tasks.clear()
+        
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        self._refresh_tasks.clear()
+        
+        if self.exchange_ws:
+            await self.exchange_ws.close()
         await self.exchange.close()
+        if self.session and not self.session.closed:
+            await self.session.close()
     
     def get_symbol(self, asset: str, use_futures: bool = True) -> str:
         """
@@ -107,6 +268,14 @@ class ExchangeClient:
         Returns:
             Formatted symbol for the exchange
         """
+        key = (asset, use_futures)
+        symbol = self._symbol_cache.get(key)
+        if symbol is None:
+            symbol = self._symbol_cache[key] = self._build_symbol(asset, use_futures)
+        return symbol
+    
+    def _build_symbol(self, asset: str, use_futures: bool) -> str:
+        """Format the exchange symbol for an asset"""
         if use_futures and self.has_futures:
             if self.exchange_name == "dydx":
                 return f"{asset}{self.futures_suffix}"
@@ -117,40 +286,168 @@ class ExchangeClient:
         else:
             return f"{asset}/USDT"
     
-    async def get_market_data(self, asset: str, use_futures: bool = True) -> Optional[SpotMarket]:
+    @staticmethod
+    async def _gather_limited(coros: List, semaphore: Optional[asyncio.Semaphore] = None) -> List[Any]:
+        """Run coroutines concurrently, optionally capped by a semaphore"""
+        if semaphore is not None:
+            async def _limited(coro):
+                async with semaphore:
+                    return await coro
+            coros = [_limited(coro) for coro in coros]
+        
+        return await asyncio.gather(*coros, return_exceptions=True)
+    
+    async def get_market_data(
+        self,
+        asset: str,
+        use_futures: bool = True,
+        include_depth: bool = True
+    ) -> Optional[SpotMarket]:
         """
         Get current market data for an asset
         
         Args:
             asset: Asset symbol (BTC, ETH, etc.)
             use_futures: Whether to use futures market
+            include_depth: Take bid/ask from the order book; when False only
+                the ticker is fetched (one request, possibly staler bid/ask)
         
         Returns:
             SpotMarket data
         """
+        # Serve the background-refreshed quote while it is fresh
+        cached = self._quotes.get((asset, use_futures))
+        if cached is not None and time.monotonic() - cached[0] < self.quote_max_age:
+            return cached[1]
+        
+        return await self._fetch_market_data(asset, use_futures, include_depth)
+    
+    async def _fetch_market_data(
+        self,
+        asset: str,
+        use_futures: bool,
+        include_depth: bool = True
+    ) -> Optional[SpotMarket]:
+        """Fetch market data over REST"""
         try:
             symbol = self.get_symbol(asset, use_futures)
             
-            # Fetch ticker
-            ticker = await self.exchange.fetch_ticker(symbol)
-            
-            # Fetch order book for better bid/ask
-            order_book = await self.exchange.fetch_order_book(symbol, limit=5)
+            if include_depth:
+                # Fetch ticker and order book (for better bid/ask) concurrently
+                ticker, order_book = await asyncio.gather(
+                    self.exchange.fetch_ticker(symbol),
+                    self.exchange.fetch_order_book(symbol, limit=5)
+                )
+            else:
+                ticker = await self.exchange.fetch_ticker(symbol)
+                order_book = {'bids': [], 'asks': []}
             
-            return SpotMarket(
-                exchange=self.exchange_name,
-                symbol=symbol,
-                bid=Decimal(str(order_book['bids'][0][0])) if order_book['bids'] else Decimal(str(ticker['bid'])),
-                ask=Decimal(str(order_book['asks'][0][0])) if order_book['asks'] else Decimal(str(ticker['ask'])),
-                last=Decimal(str(ticker['last'])),
-                volume_24h=Decimal(str(ticker['quoteVolume']))
-            )
+            return self._market_from_ticker(symbol, ticker, order_book)
             
         except Exception as e:
             bot_logger.error(f"Error fetching market data for {asset}: {e}")
             return None
     
-    async def get_order_book(self, asset: str, use_futures: bool = True, limit: int = 20) -> Dict[str, List[PriceLevel]]:
+    def _market_from_ticker(
+        self,
+        symbol: str,
+        ticker: Dict[str, Any],
+        order_book: Optional[Dict[str, Any]] = None
+    ) -> SpotMarket:
+        """Build a SpotMarket from a ccxt ticker, preferring book top for bid/ask"""
+        bids = order_book['bids'] if order_book else None
+        asks = order_book['asks'] if order_book else None
+        return SpotMarket(
+            exchange=self.exchange_name,
+            symbol=symbol,
+            bid=_to_decimal(bids[0][0] if bids else ticker['bid']),
+            ask=_to_decimal(asks[0][0] if asks else ticker['ask']),
+            last=_to_decimal(ticker['last']),
+            volume_24h=_to_decimal(ticker['quoteVolume'])
+        )
+    
+    def subscribe(self, asset: str, use_futures: bool = True, interval: float = 1.0):
+        """
+        Refresh an asset's quote in the background
+        
+        While subscribed, get_market_data is an in-memory read unless the
+        quote is older than quote_max_age. Uses ccxt.pro watch_ticker when
+        available; otherwise polls the REST ticker alone, never faster than
+        the exchange's rateLimit, so the polling does not queue order and
+        balance calls behind it in ccxt's shared throttler.
+        
+        Args:
+            asset: Asset symbol
+            use_futures: Whether to use futures market
+            interval: Seconds between REST refreshes
+        """
+        key = (asset, use_futures)
+        if key not in self._refresh_tasks:
+            self._refresh_tasks[key] = asyncio.create_task(
+                self._refresh_loop(asset, use_futures, interval)
+            )
+    
+    async def _refresh_loop(self, asset: str, use_futures: bool, interval: float):
+        """Keep the cached quote for an asset current"""
+        key = (asset, use_futures)
+        
+        if self.exchange_ws and self.exchange_ws.has.get('watchTicker'):
+            symbol = self.get_symbol(asset, use_futures)
+            while True:
+                try:
+                    ticker = await self.exchange_ws.watch_ticker(symbol)
+                    self._quotes[key] = (time.monotonic(), self._market_from_ticker(symbol, ticker))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    bot_logger.error(f"Ticker stream error for {symbol}: {e}")
+                    self._quotes.pop(key, None)
+                    await asyncio.sleep(5)
+        
+        # ccxt's rateLimit is the minimum milliseconds between requests
+        interval = max(interval, self.exchange.rateLimit / 1000)
+        while True:
+            market = await self._fetch_market_data(asset, use_futures, include_depth=False)
+            if market:
+                self._quotes[key] = (time.monotonic(), market)
+            await asyncio.sleep(interval)
+    
+    async def get_market_data_many(
+        self,
+        assets: List[str],
+        use_futures: bool = True,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        include_depth: bool = True
+    ) -> Dict[str, Optional[SpotMarket]]:
+        """
+        Get market data for several assets concurrently
+        
+        Requests are still paced by ccxt's built-in rate limiter.
+        
+        Args:
+            assets: Asset symbols (BTC, ETH, etc.)
+            use_futures: Whether to use futures markets
+            semaphore: Optional cap on in-flight requests
+            include_depth: Whether to fetch order books for bid/ask
+        
+        Returns:
+            Dictionary of asset -> SpotMarket (None on failure)
+        """
+        results = await self._gather_limited(
+            [self.get_market_data(asset, use_futures, include_depth) for asset in assets],
+            semaphore
+        )
+        
+        markets = {}
+        for asset, result in zip(assets, results):
+            if isinstance(result, Exception):
+                bot_logger.error(f"Error fetching market data for {asset}: {result}")
+                result = None
+            markets[asset] = result
+        
+        return markets
+    
+    async def get_order_book(self, asset: str, use_futures: bool = True, limit: int = 20) -> OrderBookSnapshot:
         """
         Get order book for an asset
         
@@ -160,33 +457,174 @@ class ExchangeClient:
             limit: Number of price levels to fetch
         
         Returns:
-            Dictionary with 'bids' and 'asks' price levels
+            OrderBookSnapshot with bid and ask price levels
         """
+        symbol = self.get_symbol(asset, use_futures)
+        
+        # Serve from the streamed book while it is fresh
+        cached = self._book_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self.book_max_age:
+            return cached[1].to_price_levels(limit)
+        
         try:
-            symbol = self.get_symbol(asset, use_futures)
             order_book = await self.exchange.fetch_order_book(symbol, limit=limit)
             
             bids = [
                 PriceLevel(
-                    price=Decimal(str(price)),
-                    quantity=Decimal(str(quantity))
+                    price=_to_decimal(price),
+                    quantity=_to_decimal(quantity)
                 )
                 for price, quantity in order_book['bids']
             ]
             
             asks = [
                 PriceLevel(
-                    price=Decimal(str(price)),
-                    quantity=Decimal(str(quantity))
+                    price=_to_decimal(price),
+                    quantity=_to_decimal(quantity)
                 )
                 for price, quantity in order_book['asks']
             ]
             
-            return {"bids": bids, "asks": asks}
+            return OrderBookSnapshot(bids=bids, asks=asks)
+            
+        except Exception as e:
+            bot_logger.error(f"Error fetching order book: {e}")
+            return OrderBookSnapshot([], [])
+    
+    async def get_order_book_arrays(
+        self,
+        asset: str,
+        use_futures: bool = True,
+        limit: int = 20
+    ) -> OrderBookArrays:
+        """
+        Get order book as float64 price/quantity columns
+        
+        Cheaper than get_order_book when callers only need float math;
+        use OrderBookArrays.to_price_levels() for the Decimal layout.
+        
+        Args:
+            asset: Asset symbol
+            use_futures: Whether to use futures market
+            limit: Number of price levels to fetch
+        
+        Returns:
+            OrderBookArrays with bid/ask columns
+        """
+        try:
+            symbol = self.get_symbol(asset, use_futures)
+            order_book = await self.exchange.fetch_order_book(symbol, limit=limit)
+            
+            return _to_book_arrays(order_book['bids'], order_book['asks'])
             
         except Exception as e:
             bot_logger.error(f"Error fetching order book: {e}")
-            return {"bids": [], "asks": []}
+            empty = np.empty(0, dtype=np.float64)
+            return OrderBookArrays(empty, empty, empty, empty)
+    
+    async def stream_order_book(
+        self,
+        asset: str,
+        use_futures: bool = True,
+        limit: int = 20
+    ) -> AsyncIterator[OrderBookArrays]:
+        """
+        Stream order book snapshots over WebSocket
+        
+        Uses ccxt.pro watch_order_book, which maintains a diff-applied book,
+        and falls back to REST polling when ccxt.pro is unavailable.
+        
+        Args:
+            asset: Asset symbol
+            use_futures: Whether to use futures market
+            limit: Number of price levels per snapshot
+        
+        Yields:
+            OrderBookArrays snapshots
+        """
+        symbol = self.get_symbol(asset, use_futures)
+        
+        try:
+            while True:
+                if self.exchange_ws:
+                    order_book = await self.exchange_ws.watch_order_book(symbol, limit=limit)
+                else:
+                    order_book = await self.exchange.fetch_order_book(symbol, limit=limit)
+                    await asyncio.sleep(1)
+                
+                book = _to_book_arrays(order_book['bids'][:limit], order_book['asks'][:limit])
+                self._book_cache[symbol] = (time.monotonic(), book)
+                yield book
+        finally:
+            # Nothing keeps the cached book current once the stream ends
+            self._book_cache.pop(symbol, None)
+    
+    def start_order_book_streams(self, assets: List[str], use_futures: bool = True):
+        """
+        Keep streamed order books for assets in memory
+        
+        Once started, get_order_book for these assets is served from the
+        cache instead of a REST call.
+        
+        Args:
+            assets: Asset symbols to stream
+            use_futures: Whether to use futures markets
+        """
+        if not self.exchange_ws:
+            bot_logger.warning("ccxt.pro not installed, order books will use REST")
+            return
+        
+        for asset in assets:
+            self._book_tasks.append(
+                asyncio.create_task(self._consume_order_book(asset, use_futures))
+            )
+    
+    async def _consume_order_book(self, asset: str, use_futures: bool):
+        """Drive a stream_order_book generator, restarting it on failure"""
+        symbol = self.get_symbol(asset, use_futures)
+        
+        while True:
+            try:
+                async for _ in self.stream_order_book(asset, use_futures):
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                bot_logger.error(f"Order book stream error for {symbol}: {e}")
+                await asyncio.sleep(5)
+    
+    async def get_order_book_many(
+        self,
+        assets: List[str],
+        use_futures: bool = True,
+        limit: int = 20,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, OrderBookSnapshot]:
+        """
+        Get order books for several assets concurrently
+        
+        Args:
+            assets: Asset symbols
+            use_futures: Whether to use futures markets
+            limit: Number of price levels to fetch
+            semaphore: Optional cap on in-flight requests
+        
+        Returns:
+            Dictionary of asset -> order book
+        """
+        results = await self._gather_limited(
+            [self.get_order_book(asset, use_futures, limit) for asset in assets],
+            semaphore
+        )
+        
+        books = {}
+        for asset, result in zip(assets, results):
+            if isinstance(result, Exception):
+                bot_logger.error(f"Error fetching order book for {asset}: {result}")
+                result = OrderBookSnapshot([], [])
+            books[asset] = result
+        
+        return books
     
     async def place_order(
         self,
@@ -216,37 +654,34 @@ class ExchangeClient:
         try:
             symbol = self.get_symbol(asset, use_futures)
             
-            # Convert side
-            order_side = 'buy' if side == MarketSide.LONG else 'sell'
-            
-            # Convert order type
-            order_type_str = 'market' if order_type == OrderType.MARKET else 'limit'
+            # Convert side and order type
+            order_side = _SIDE_STR[side]
+            order_type_str = _TYPE_STR[order_type]
             
             # Prepare parameters
-            params = {}
-            if use_futures and self.has_futures:
-                params['reduceOnly'] = reduce_only
+            params = self._params_cache[(use_futures and self.has_futures, reduce_only)]
             
             # Place order
-            if order_type == OrderType.MARKET:
-                order = await self.exchange.create_order(
-                    symbol=symbol,
-                    type=order_type_str,
-                    side=order_side,
-                    amount=float(quantity),
-                    params=params
-                )
+            if order_type is OrderType.MARKET:
+                order_price = None
             else:
                 if price is None:
                     raise ValueError("Price required for limit orders")
-                
-                order = await self.exchange.create_order(
-                    symbol=symbol,
-                    type=order_type_str,
-                    side=order_side,
-                    amount=float(quantity),
-                    price=float(price),
-                    params=params
+                order_price = float(price)
+            
+            # Only rate-limit rejections are retried; a network error could
+            # mean the order reached the exchange
+            async with self._order_sem:
+                order = await _with_backoff(
+                    lambda: self.exchange.create_order(
+                        symbol=symbol,
+                        type=order_type_str,
+                        side=order_side,
+                        amount=float(quantity),
+                        price=order_price,
+                        params=params
+                    ),
+                    retry_on=(ccxt.RateLimitExceeded,)
                 )
             
             order_id = order['id']
@@ -262,6 +697,54 @@ class ExchangeClient:
             bot_logger.error(f"Error placing order: {e}")
             return None
     
+    async def open_position(
+        self,
+        asset: str,
+        side: MarketSide,
+        order_type: OrderType,
+        quantity: Decimal,
+        leverage: int,
+        price: Optional[Decimal] = None,
+        required_margin: Optional[Decimal] = None
+    ) -> Optional[str]:
+        """
+        Open a leveraged futures position
+        
+        Leverage is idempotent, so it is set concurrently with the balance
+        check and the order goes out as soon as both return.
+        
+        Args:
+            asset: Asset to trade
+            side: LONG or SHORT
+            order_type: MARKET or LIMIT
+            quantity: Order quantity
+            leverage: Leverage to apply before the order
+            price: Limit price (required for LIMIT orders)
+            required_margin: Minimum USDT balance needed to proceed
+        
+        Returns:
+            Order ID if successful
+        """
+        leverage_ok, balances = await asyncio.gather(
+            self.set_leverage(asset, leverage),
+            self.get_balance()
+        )
+        
+        if not leverage_ok:
+            return None
+        
+        if required_margin is not None and balances.get("USDT", Decimal(0)) < required_margin:
+            bot_logger.warning(f"Insufficient margin to open {asset} position")
+            return None
+        
+        return await self.place_order(
+            asset=asset,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price
+        )
+    
     async def get_order_status(self, order_id: str, asset: str, use_futures: bool = True) -> Dict[str, Any]:
         """Get status of a specific order"""
         try:
@@ -276,7 +759,11 @@ class ExchangeClient:
         """Cancel an open order"""
         try:
             symbol = self.get_symbol(asset, use_futures)
-            result = await self.exchange.cancel_order(order_id, symbol)
+            async with self._order_sem:
+                result = await _with_backoff(
+                    lambda: self.exchange.cancel_order(order_id, symbol),
+                    retry_on=(ccxt.NetworkError,)
+                )
             
             if result:
                 bot_logger.info(f"Cancelled order: {order_id}")
@@ -287,6 +774,35 @@ class ExchangeClient:
             bot_logger.error(f"Error cancelling order: {e}")
             return False
     
+    async def cancel_orders_many(
+        self,
+        order_ids: List[str],
+        asset: str,
+        use_futures: bool = True,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, bool]:
+        """
+        Cancel several open orders concurrently
+        
+        Args:
+            order_ids: Orders to cancel
+            asset: Asset the orders belong to
+            use_futures: Whether the orders are on the futures market
+            semaphore: Optional cap on in-flight requests
+        
+        Returns:
+            Dictionary of order ID -> success status
+        """
+        results = await self._gather_limited(
+            [self.cancel_order(order_id, asset, use_futures) for order_id in order_ids],
+            semaphore
+        )
+        
+        return {
+            order_id: result is True
+            for order_id, result in zip(order_ids, results)
+        }
+    
     async def get_positions(self, asset: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get open positions
@@ -304,9 +820,15 @@ class ExchangeClient:
             
             if asset:
                 symbol = self.get_symbol(asset, use_futures=True)
-                positions = await self.exchange.fetch_positions([symbol])
+                positions = await _with_backoff(
+                    lambda: self.exchange.fetch_positions([symbol]),
+                    retry_on=(ccxt.NetworkError,)
+                )
             else:
-                positions = await self.exchange.fetch_positions()
+                positions = await _with_backoff(
+                    self.exchange.fetch_positions,
+                    retry_on=(ccxt.NetworkError,)
+                )
             
             return positions
             
@@ -324,13 +846,12 @@ class ExchangeClient:
         try:
             balance = await self.exchange.fetch_balance()
             
-            # Extract free balances
-            balances = {}
-            for currency, details in balance['total'].items():
-                if details > 0:
-                    balances[currency] = Decimal(str(details))
-            
-            return balances
+            # Extract non-zero balances (ccxt reports missing ones as None)
+            return {
+                currency: _to_decimal(total)
+                for currency, total in balance['total'].items()
+                if total
+            }
             
         except Exception as e:
             bot_logger.error(f"Error getting balance: {e}")
@@ -388,14 +909,21 @@ class ExchangeClient:
         Returns:
             Position size in asset units
         """
-        # Account for fees
-        effective_capital = capital * (1 - self.taker_fee)
-        
-        # Calculate with leverage
-        position_value = effective_capital * leverage
-        position_size = position_value / price
+        # Account for fees and leverage in one cached factor
+        factor = self._size_factors.get(leverage)
+        if factor is None:
+            factor = self._size_factors[leverage] = (1 - self.spec.taker_fee) * leverage
         
-        return position_size
+        return capital * factor / price
+    
+    def calculate_position_size_fast(
+        self,
+        capital: float,
+        price: float,
+        leverage: int = 1
+    ) -> float:
+        """Float variant of calculate_position_size for screening hypothetical fills"""
+        return capital * (1 - float(self.spec.taker_fee)) * leverage / price
     
     def calculate_liquidation_price(
         self,
@@ -414,15 +942,4 @@ class ExchangeClient:
         Returns:
             Liquidation price
         """
-        # Simplified calculation (actual varies by exchange)
-        # Maintenance margin is typically 0.5% for most exchanges
-        maintenance_margin = Decimal("0.005")
-        
-        if side == MarketSide.LONG:
-            # Long liquidation: price drops by (100 - maintenance_margin) / leverage %
-            liquidation_price = entry_price * (1 - (1 - maintenance_margin) / leverage)
-        else:
-            # Short liquidation: price rises by (100 - maintenance_margin) / leverage %
-            liquidation_price = entry_price * (1 + (1 - maintenance_margin) / leverage)
-        
-        return liquidation_price
+        return entry_price * _liquidation_factor(leverage, side)
@@ -4,27 +4,95 @@ Hyperliquid client for perpetual futures trading
 import asyncio
 import json
 import time
-from typing import Optional, Dict, Any, List, Tuple
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from decimal import Decimal
 from datetime import datetime
 import aiohttp
-import websockets
+import numpy as np
+import orjson
 from eth_account import Account
-from eth_account.messages import encode_defunct
+from eth_utils import keccak
 from web3 import Web3
 import hashlib
 import hmac
 
+try:
+    import coincurve
+except ImportError:  # fall back to eth_account's pure-Python signer
+    coincurve = None
+
 from src.models import (
     SpotMarket,
     MarketSide,
     OrderType,
-    PriceLevel
+    PriceLevel,
+    FastPriceLevel,
+    OrderBookArrays,
+    OrderSpec
 )
 from src.config import config
 from src.utils.logger import bot_logger
 
 
+def _signature_prefix(chain_id: int) -> str:
+    """
+    JSON of the L1 action signature input up to its message, exactly as
+    json.dumps renders the full dict; only the message varies per call
+    """
+    envelope = json.dumps({
+        "domain": {
+            "name": "Hyperliquid",
+            "version": "1",
+            "chainId": chain_id,
+            "verifyingContract": "0x0000000000000000000000000000000000000000"
+        },
+        "types": {
+            "Action": [
+                {"name": "type", "type": "string"},
+                {"name": "user", "type": "address"},
+                {"name": "nonce", "type": "uint64"}
+            ]
+        },
+        "primaryType": "Action",
+        "message": None
+    })
+    return envelope[:-len("null}")]
+
+
+# EIP-191 personal_sign header; followed by the decimal message length
+_PERSONAL_SIGN_HEADER = b"\x19Ethereum Signed Message:\n"
+
+# Fixed /info request bodies, serialized as-is and never mutated
+_ALL_MIDS_REQUEST = {"type": "allMids"}
+_META_REQUEST = {"type": "meta"}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Decimal constants used per tick
+_ZERO = Decimal(0)
+_BID_FALLBACK = Decimal("0.999")  # bid/ask around mid when the book is empty
+_ASK_FALLBACK = Decimal("1.001")
+
+# is_mainnet -> signature input prefix (Arbitrum mainnet / local testnet chain)
+_SIGNATURE_PREFIXES = {
+    True: _signature_prefix(42161),
+    False: _signature_prefix(1337)
+}
+
+
+def _asset_scales(assets: Dict[str, Dict[str, Any]]) -> Mapping[str, Tuple[int, int]]:
+    """Frozen asset -> (size scale, price scale) lookup from asset decimals"""
+    return MappingProxyType({
+        name: (10 ** asset["szDecimals"], 10 ** asset["pxDecimals"])
+        for name, asset in assets.items()
+    })
+
+
+def _round_scaled(value: float, scale: int) -> float:
+    """Round half away from zero to 1/scale steps"""
+    return int(value * scale + (0.5 if value >= 0 else -0.5)) / scale
+
+
 class HyperliquidClient:
     """Client for interacting with Hyperliquid DEX"""
     
@@ -34,6 +102,24 @@ class HyperliquidClient:
     MAINNET_WS = "wss://api.hyperliquid.xyz/ws"
     TESTNET_WS = "wss://api.hyperliquid-testnet.xyz/ws"
     
+    # Seconds a cached /info meta response stays fresh
+    META_TTL = 60
+    
+    # Seconds a cached clearinghouse state is shared between callers
+    ACCOUNT_STATE_TTL = 0.5
+    
+    # Seconds a WebSocket best bid/ask stays usable for pricing market orders
+    TOP_OF_BOOK_TTL = 1.5
+    
+    # fundingHistory window for the latest rate; funding settles hourly
+    FUNDING_LOOKBACK_MS = 2 * 3600 * 1000
+    
+    # Limit price offset applied to market (IOC) orders
+    MARKET_SLIPPAGE = 0.01
+    
+    # Attempts for unsigned requests failing with connection errors
+    REQUEST_RETRIES = 3
+    
     # Asset configurations
     ASSETS = {
         "BTC": {
@@ -59,6 +145,9 @@ class HyperliquidClient:
         }
     }
     
+    # asset -> (10 ** szDecimals, 10 ** pxDecimals)
+    _ASSET_SCALES = _asset_scales(ASSETS)
+    
     def __init__(self, is_mainnet: bool = True):
         """
         Initialize Hyperliquid client
@@ -69,28 +158,67 @@ class HyperliquidClient:
         self.is_mainnet = is_mainnet
         self.api_url = self.MAINNET_API if is_mainnet else self.TESTNET_API
         self.ws_url = self.MAINNET_WS if is_mainnet else self.TESTNET_WS
+        self._urls = {
+            "/info": f"{self.api_url}/info",
+            "/exchange": f"{self.api_url}/exchange"
+        }
         
         # Account setup
         self.private_key = config.HYPERLIQUID_PRIVATE_KEY
         self.account = Account.from_key(self.private_key)
         self.address = self.account.address
+        self._state_request = {"type": "clearinghouseState", "user": self.address}
+        
+        # Signing state precomputed once: the constant part of the signature
+        # input and the native secp256k1 key when coincurve is available
+        self._signature_prefix = _SIGNATURE_PREFIXES[is_mainnet]
+        self._signing_key = coincurve.PrivateKey(bytes(self.account.key)) if coincurve else None
         
         # Optional API wallet for trading
         self.api_wallet = config.HYPERLIQUID_API_WALLET if hasattr(config, 'HYPERLIQUID_API_WALLET') else None
         
         self.session: Optional[aiohttp.ClientSession] = None
-        self.ws: Optional[websockets.WebSocketClientProtocol] = None
+        self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
         
         # Cache for market data
         self.market_cache: Dict[str, Any] = {}
         self.funding_rates: Dict[str, Decimal] = {}
         
+        # asset -> (monotonic receive time, best bid, best ask) maintained
+        # from l2Book WebSocket updates; cleared when the socket closes
+        self._top_of_book: Dict[str, Tuple[float, float, float]] = {}
+        
+        # (fetch time, raw meta, asset name -> universe index)
+        self._meta_cache: Optional[Tuple[float, Dict[str, Any], Dict[str, int]]] = None
+        
+        # (fetch time, clearinghouse state) shared by positions/balance/orders
+        self._state_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._state_lock = asyncio.Lock()
+        
+        # (asset, depth) -> l2Book request body, built once per shape
+        self._l2_requests: Dict[Tuple[str, Optional[int]], Dict[str, Any]] = {}
+        
+        # Last nonce handed out; nonces must be unique per signer
+        self._last_nonce = 0
+        
         bot_logger.info(f"Initialized Hyperliquid client ({'mainnet' if is_mainnet else 'testnet'})")
         bot_logger.info(f"Trading address: {self.address}")
     
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Create a keep-alive session pooled for the many small /info POSTs"""
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        return aiohttp.ClientSession(connector=connector)
+    
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        self.session = self._create_session()
+        await self.refresh_meta()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -99,10 +227,11 @@ class HyperliquidClient:
 
     async def close(self):
         """Close all open connections"""
-        if self.session:
-            await self.session.close()
+        # The WebSocket rides on the session, so close it first
         if self.ws:
             await self.ws.close()
+        if self.session:
+            await self.session.close()
 
     async def _make_request(
         self,
@@ -124,32 +253,37 @@ class HyperliquidClient:
             Response data
         """
         if not self.session:
-            self.session = aiohttp.ClientSession()
-        
-        url = f"{self.api_url}{endpoint}"
+            self.session = self._create_session()
         
-        headers = {
-            "Content-Type": "application/json"
-        }
+        url = self._urls.get(endpoint) or f"{self.api_url}{endpoint}"
         
         if signed and data:
             # Sign the request
             signature = self._sign_request(data)
             data["signature"] = signature
         
-        try:
-            if method == "GET":
-                async with self.session.get(url, params=data, headers=headers) as response:
-                    return await response.json()
-            elif method == "POST":
-                async with self.session.post(url, json=data, headers=headers) as response:
-                    return await response.json()
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-                
-        except Exception as e:
-            bot_logger.error(f"API request failed: {e}")
-            return {}
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        # Only unsigned reads are retried; signed actions go out once
+        attempts = 1 if signed else self.REQUEST_RETRIES
+        for attempt in range(attempts):
+            try:
+                if method == "GET":
+                    async with self.session.get(url, params=data, headers=_JSON_HEADERS) as response:
+                        return orjson.loads(await response.read())
+                async with self.session.post(url, data=orjson.dumps(data), headers=_JSON_HEADERS) as response:
+                    return orjson.loads(await response.read())
+                    
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < attempts - 1:
+                    await asyncio.sleep(0.05 * 2 ** attempt)
+                    continue
+                bot_logger.error(f"API request failed: {e}")
+                return {}
+            except orjson.JSONDecodeError as e:
+                bot_logger.error(f"API returned invalid JSON: {e}")
+                return {}
     
     def _sign_request(self, data: Dict) -> str:
         """
@@ -161,14 +295,26 @@ class HyperliquidClient:
         Returns:
             Signature hex string
         """
-        # Hyperliquid uses EIP-712 signing
-        message = json.dumps(data, sort_keys=True)
-        message_hash = hashlib.sha256(message.encode()).digest()
+        # Hyperliquid uses EIP-712 signing. The signed bytes are the stdlib
+        # json rendering (", "/": " separators, ASCII-escaped); orjson's
+        # compact output would change the digest
+        message = json.dumps(data, sort_keys=True).encode()
+        message_hash = hashlib.sha256(message).digest()
         
         # Sign with private key
-        signed_message = self.account.signHash(message_hash)
+        return self._sign_digest(message_hash)
+    
+    def _next_nonce(self) -> int:
+        """
+        Next L1 action nonce
         
-        return signed_message.signature.hex()
+        Millisecond timestamps, bumped past the previous nonce so bursts
+        within one millisecond (cancel/replace loops) never collide.
+        Runs synchronously on the event loop, so no lock is needed.
+        """
+        nonce = max(time.time_ns() // 1_000_000, self._last_nonce + 1)
+        self._last_nonce = nonce
+        return nonce
     
     def _sign_l1_action(
         self,
@@ -195,48 +341,88 @@ class HyperliquidClient:
             **action_data
         }
         
-        # Create signature
-        signature_input = {
-            "domain": {
-                "name": "Hyperliquid",
-                "version": "1",
-                "chainId": 1337 if not self.is_mainnet else 42161,  # Arbitrum mainnet
-                "verifyingContract": "0x0000000000000000000000000000000000000000"
-            },
-            "types": {
-                "Action": [
-                    {"name": "type", "type": "string"},
-                    {"name": "user", "type": "address"},
-                    {"name": "nonce", "type": "uint64"}
-                ]
-            },
-            "primaryType": "Action",
-            "message": action
-        }
-        
-        # Sign the structured data
-        encoded = encode_defunct(json.dumps(signature_input))
-        signed = self.account.sign_message(encoded)
+        # personal_sign over the JSON signature input. Only the action is
+        # serialized per call; the domain/types prefix is built once, and the
+        # EIP-191 digest is hashed directly instead of via encode_defunct
+        message = f"{self._signature_prefix}{json.dumps(action)}}}".encode()
+        digest = keccak(_PERSONAL_SIGN_HEADER + str(len(message)).encode() + message)
         
         return {
             "action": action,
-            "signature": signed.signature.hex()
+            "signature": self._sign_digest(digest)
         }
     
+    def _sign_digest(self, digest: bytes) -> str:
+        """
+        Sign a 32-byte digest with the account key
+        
+        Args:
+            digest: Message digest
+        
+        Returns:
+            65-byte r || s || v signature hex string
+        """
+        if self._signing_key is not None:
+            signature = self._signing_key.sign_recoverable(digest, hasher=None)
+            return (signature[:64] + bytes([signature[64] + 27])).hex()
+        
+        return self.account.unsafe_sign_hash(digest).signature.hex()
+    
     async def get_account_state(self) -> Dict[str, Any]:
-        """Get account state including balances and positions"""
-        try:
-            data = {
-                "type": "clearinghouseState",
-                "user": self.address
-            }
-            
-            response = await self._make_request("POST", "/info", data)
-            return response
+        """
+        Get account state including balances and positions
+        
+        Responses are shared for ACCOUNT_STATE_TTL seconds so positions,
+        balance and open orders fetched together cost one request.
+        """
+        cached = self._state_cache
+        if cached and time.time() - cached[0] < self.ACCOUNT_STATE_TTL:
+            return cached[1]
+        
+        async with self._state_lock:
+            # Another caller may have refreshed while we waited
+            cached = self._state_cache
+            if cached and time.time() - cached[0] < self.ACCOUNT_STATE_TTL:
+                return cached[1]
             
-        except Exception as e:
-            bot_logger.error(f"Error getting account state: {e}")
-            return {}
+            try:
+                response = await self._make_request("POST", "/info", self._state_request)
+                if response:
+                    self._state_cache = (time.time(), response)
+                return response
+                
+            except Exception as e:
+                bot_logger.error(f"Error getting account state: {e}")
+                return {}
+    
+    def invalidate_account_state(self):
+        """Drop the cached account state after a mutating action"""
+        self._state_cache = None
+    
+    async def refresh_meta(self) -> Dict[str, Any]:
+        """
+        Fetch /info meta and rebuild the asset index lookup
+        
+        Returns:
+            Raw meta response
+        """
+        meta = await self._make_request("POST", "/info", _META_REQUEST)
+        if meta:
+            index = {
+                universe["name"]: i
+                for i, universe in enumerate(meta.get("universe", []))
+            }
+            self._meta_cache = (time.time(), meta, index)
+        return meta
+    
+    async def _get_meta(self) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Return cached meta and asset index, refreshing after META_TTL"""
+        if self._meta_cache is None or time.time() - self._meta_cache[0] >= self.META_TTL:
+            await self.refresh_meta()
+        
+        if self._meta_cache is None:
+            return {}, {}
+        return self._meta_cache[1], self._meta_cache[2]
     
     async def get_market_data(self, asset: str) -> Optional[SpotMarket]:
         """
@@ -249,54 +435,52 @@ class HyperliquidClient:
             SpotMarket data
         """
         try:
-            # Get meta info for all assets
-            meta_response = await self._make_request("POST", "/info", {"type": "meta"})
+            # Independent /info requests go out concurrently. Only the top
+            # of book and the latest funding entry are read, so ask for one
+            # level and a short funding window rather than parsing a full
+            # book and a day of history per call
+            meta_result, prices_response, orderbook_response, funding_response = await asyncio.gather(
+                self._get_meta(),
+                self._make_request("POST", "/info", _ALL_MIDS_REQUEST),
+                self._make_request("POST", "/info", self._l2_request(asset, 1)),
+                self._make_request(
+                    "POST",
+                    "/info",
+                    {"type": "fundingHistory", "coin": asset, "startTime": int(time.time() * 1000) - self.FUNDING_LOOKBACK_MS}
+                ),
+                return_exceptions=True
+            )
+            
+            if isinstance(meta_result, Exception):
+                bot_logger.error(f"Error fetching Hyperliquid meta: {meta_result}")
+                return None
+            if isinstance(prices_response, Exception):
+                bot_logger.error(f"Error fetching Hyperliquid mids: {prices_response}")
+                return None
+            if isinstance(orderbook_response, Exception):
+                # Fall back to mid-derived bid/ask below
+                orderbook_response = {}
             
             # Find the asset
-            asset_info = None
-            for universe in meta_response.get("universe", []):
-                if universe["name"] == asset:
-                    asset_info = universe
-                    break
+            meta_response, asset_index_map = meta_result
+            universe_index = asset_index_map.get(asset)
+            asset_info = meta_response["universe"][universe_index] if universe_index is not None else None
             
             if not asset_info:
                 bot_logger.error(f"Asset {asset} not found on Hyperliquid")
                 return None
             
-            # Get current prices
-            prices_response = await self._make_request(
-                "POST",
-                "/info",
-                {"type": "allMids"}
-            )
-            
-            # Get order book for better bid/ask
-            orderbook_response = await self._make_request(
-                "POST",
-                "/info",
-                {
-                    "type": "l2Book",
-                    "coin": asset
-                }
-            )
-            
             # Parse data
-            asset_index = asset_info.get("index", 0)
+            asset_index = asset_info.get("index", universe_index)
             current_price = Decimal(prices_response.get("mids", [{}])[asset_index])
             
             orderbook = orderbook_response.get("levels", {})
-            best_bid = Decimal(orderbook[0][0]["px"]) if orderbook else current_price * Decimal("0.999")
-            best_ask = Decimal(orderbook[1][0]["px"]) if orderbook and len(orderbook) > 1 else current_price * Decimal("1.001")
+            best_bid = Decimal(orderbook[0][0]["px"]) if orderbook else current_price * _BID_FALLBACK
+            best_ask = Decimal(orderbook[1][0]["px"]) if orderbook and len(orderbook) > 1 else current_price * _ASK_FALLBACK
             
-            # Get funding rate
-            funding_response = await self._make_request(
-                "POST",
-                "/info",
-                {"type": "fundingHistory", "coin": asset, "startTime": int(time.time() * 1000) - 86400000}
-            )
-            
-            if funding_response:
-                latest_funding = funding_response[-1] if funding_response else {}
+            # Update funding rate
+            if funding_response and not isinstance(funding_response, Exception):
+                latest_funding = funding_response[-1]
                 self.funding_rates[asset] = Decimal(latest_funding.get("fundingRate", "0"))
             
             return SpotMarket(
@@ -312,6 +496,26 @@ class HyperliquidClient:
             bot_logger.error(f"Error fetching market data: {e}")
             return None
     
+    def _l2_request(self, asset: str, depth: Optional[int] = None) -> Dict[str, Any]:
+        """Cached l2Book request body for an asset and depth"""
+        request = self._l2_requests.get((asset, depth))
+        if request is None:
+            request = {"type": "l2Book", "coin": asset}
+            if depth is not None:
+                request["nLevels"] = depth
+            self._l2_requests[(asset, depth)] = request
+        return request
+    
+    async def _fetch_l2_levels(self, asset: str, depth: int) -> List[List[Dict[str, Any]]]:
+        """Fetch raw l2Book [bids, asks] levels"""
+        response = await self._make_request("POST", "/info", self._l2_request(asset, depth))
+        
+        levels = response.get("levels", [[],[]])
+        return [
+            levels[0][:depth] if levels and len(levels) > 0 else [],
+            levels[1][:depth] if levels and len(levels) > 1 else []
+        ]
+    
     async def get_order_book(self, asset: str, depth: int = 20) -> Dict[str, List[PriceLevel]]:
         """
         Get order book for an asset
@@ -324,40 +528,101 @@ class HyperliquidClient:
             Dictionary with 'bids' and 'asks'
         """
         try:
-            response = await self._make_request(
-                "POST",
-                "/info",
-                {
-                    "type": "l2Book",
-                    "coin": asset,
-                    "nLevels": depth
-                }
-            )
+            bid_levels, ask_levels = await self._fetch_l2_levels(asset, depth)
             
-            levels = response.get("levels", [[],[]])
-            
-            bids = [
-                PriceLevel(
-                    price=Decimal(level["px"]),
-                    quantity=Decimal(level["sz"])
-                )
-                for level in levels[0][:depth]
-            ] if levels and len(levels) > 0 else []
+            return {
+                "bids": [PriceLevel(Decimal(level["px"]), Decimal(level["sz"])) for level in bid_levels],
+                "asks": [PriceLevel(Decimal(level["px"]), Decimal(level["sz"])) for level in ask_levels]
+            }
             
-            asks = [
-                PriceLevel(
-                    price=Decimal(level["px"]),
-                    quantity=Decimal(level["sz"])
-                )
-                for level in levels[1][:depth]
-            ] if levels and len(levels) > 1 else []
+        except Exception as e:
+            bot_logger.error(f"Error fetching order book: {e}")
+            return {"bids": [], "asks": []}
+    
+    async def get_order_book_fast(self, asset: str, depth: int = 20) -> Dict[str, List[FastPriceLevel]]:
+        """
+        Get order book with float levels, skipping Decimal parsing
+        
+        Use FastPriceLevel.to_price_level() where exact arithmetic is needed.
+        
+        Args:
+            asset: Asset symbol
+            depth: Number of price levels
+        
+        Returns:
+            Dictionary with 'bids' and 'asks'
+        """
+        try:
+            bid_levels, ask_levels = await self._fetch_l2_levels(asset, depth)
             
-            return {"bids": bids, "asks": asks}
+            return {
+                "bids": [FastPriceLevel(float(level["px"]), float(level["sz"])) for level in bid_levels],
+                "asks": [FastPriceLevel(float(level["px"]), float(level["sz"])) for level in ask_levels]
+            }
             
         except Exception as e:
             bot_logger.error(f"Error fetching order book: {e}")
             return {"bids": [], "asks": []}
     
+    @staticmethod
+    def _levels_to_arrays(
+        bid_levels: List[Dict[str, Any]],
+        ask_levels: List[Dict[str, Any]]
+    ) -> OrderBookArrays:
+        """Build float64 book columns from l2Book {"px", "sz"} levels"""
+        return OrderBookArrays(
+            bids_px=np.fromiter((float(level["px"]) for level in bid_levels), dtype=np.float64, count=len(bid_levels)),
+            bids_qty=np.fromiter((float(level["sz"]) for level in bid_levels), dtype=np.float64, count=len(bid_levels)),
+            asks_px=np.fromiter((float(level["px"]) for level in ask_levels), dtype=np.float64, count=len(ask_levels)),
+            asks_qty=np.fromiter((float(level["sz"]) for level in ask_levels), dtype=np.float64, count=len(ask_levels))
+        )
+    
+    @classmethod
+    def parse_l2_update(cls, message: Dict[str, Any]) -> Optional[OrderBookArrays]:
+        """
+        Convert an l2Book WebSocket message into book arrays
+        
+        Lets subscribe_to_market_data callbacks reduce updates with
+        OrderBookArrays.summary() instead of walking the level dicts.
+        
+        Args:
+            message: Decoded WebSocket message
+        
+        Returns:
+            OrderBookArrays, or None for non-l2Book messages
+        """
+        if message.get("channel") != "l2Book":
+            return None
+        
+        levels = message.get("data", {}).get("levels", [])
+        return cls._levels_to_arrays(
+            levels[0] if len(levels) > 0 else [],
+            levels[1] if len(levels) > 1 else []
+        )
+    
+    async def get_order_book_arrays(self, asset: str, depth: int = 20) -> OrderBookArrays:
+        """
+        Get order book as contiguous float64 price/size columns
+        
+        Suited to vectorized VWAP, spread and depth-curve math; use
+        OrderBookArrays.to_price_levels() for Decimal levels.
+        
+        Args:
+            asset: Asset symbol
+            depth: Number of price levels
+        
+        Returns:
+            OrderBookArrays with bid/ask columns
+        """
+        try:
+            bid_levels, ask_levels = await self._fetch_l2_levels(asset, depth)
+            return self._levels_to_arrays(bid_levels, ask_levels)
+            
+        except Exception as e:
+            bot_logger.error(f"Error fetching order book: {e}")
+            empty = np.empty(0, dtype=np.float64)
+            return OrderBookArrays(empty, empty, empty, empty)
+    
     async def place_order(
         self,
         asset: str,
@@ -385,51 +650,145 @@ class HyperliquidClient:
         Returns:
             Order ID if successful
         """
-        try:
-            # Get asset configuration
-            asset_config = self.ASSETS.get(asset)
-            if not asset_config:
-                bot_logger.error(f"Asset {asset} not supported")
+        order_ids = await self.place_orders([
+            OrderSpec(
+                asset=asset,
+                side=side,
+                order_type=order_type,
+                quantity=quantity,
+                price=price,
+                leverage=leverage,
+                reduce_only=reduce_only,
+                post_only=post_only
+            )
+        ])
+        return order_ids[0]
+    
+    async def _get_top_of_book(self, asset: str) -> Optional[Tuple[float, float]]:
+        """
+        Best bid/ask for pricing market orders
+        
+        Served from the WebSocket-maintained cache while it is younger than
+        TOP_OF_BOOK_TTL; otherwise falls back to the mid from a single
+        allMids request.
+        
+        Args:
+            asset: Asset symbol
+        
+        Returns:
+            Tuple of (bid, ask), or None if no price is available
+        """
+        top = self._top_of_book.get(asset)
+        if top is not None and time.monotonic() - top[0] < self.TOP_OF_BOOK_TTL:
+            return top[1], top[2]
+        
+        mids = await self._make_request("POST", "/info", _ALL_MIDS_REQUEST)
+        mid = mids.get(asset) if isinstance(mids, dict) else None
+        if mid is None:
+            return None
+        
+        mid = float(mid)
+        return mid, mid
+    
+    def _update_top_of_book(self, message: Dict[str, Any]):
+        """Record best bid/ask from an l2Book WebSocket message"""
+        if message.get("channel") != "l2Book":
+            return
+        
+        data = message.get("data", {})
+        levels = data.get("levels", [])
+        if len(levels) > 1 and levels[0] and levels[1]:
+            self._top_of_book[data.get("coin")] = (
+                time.monotonic(),
+                float(levels[0][0]["px"]),
+                float(levels[1][0]["px"])
+            )
+    
+    async def _build_order(self, spec: OrderSpec) -> Optional[Dict[str, Any]]:
+        """
+        Build the wire order for a spec, pricing market orders
+        
+        Args:
+            spec: Order parameters
+        
+        Returns:
+            Order dict for the "order" action, or None if unsupported
+        """
+        scales = self._ASSET_SCALES.get(spec.asset)
+        if scales is None:
+            bot_logger.error(f"Asset {spec.asset} not supported")
+            return None
+        sz_scale, px_scale = scales
+        
+        # Round size and price according to asset decimals
+        quantity = _round_scaled(float(spec.quantity), sz_scale)
+        
+        # Determine order price
+        price = spec.price
+        if spec.order_type == OrderType.MARKET:
+            # For market orders, use a limit price with slippage
+            top = await self._get_top_of_book(spec.asset)
+            if top is None:
+                bot_logger.error(f"No price available for {spec.asset}")
                 return None
-            
-            # Set leverage if provided
-            if leverage and not reduce_only:
-                await self.set_leverage(asset, leverage)
-            
-            # Get nonce
-            nonce = int(time.time() * 1000)
-            
-            # Round size and price according to asset decimals
-            quantity = round(float(quantity), asset_config["szDecimals"])
-            
-            # Determine order price
-            if order_type == OrderType.MARKET:
-                # For market orders, use a limit price with slippage
-                market_data = await self.get_market_data(asset)
-                if side == MarketSide.LONG:
-                    price = float(market_data.ask * Decimal("1.01"))  # 1% slippage
-                else:
-                    price = float(market_data.bid * Decimal("0.99"))
-            
-            price = round(float(price), asset_config["pxDecimals"])
-            
-            # Create order
-            order_data = {
-                "coin": asset,
-                "is_buy": side == MarketSide.LONG,
-                "sz": quantity,
-                "limit_px": price,
-                "order_type": {
-                    "limit": {
-                        "tif": "Ioc" if order_type == OrderType.MARKET else "Gtc"
-                    }
-                },
-                "reduce_only": reduce_only,
-                "grouping": "na"
+            bid, ask = top
+            if spec.side == MarketSide.LONG:
+                price = ask * (1 + self.MARKET_SLIPPAGE)
+            else:
+                price = bid * (1 - self.MARKET_SLIPPAGE)
+        
+        price = _round_scaled(float(price), px_scale)
+        
+        return {
+            "coin": spec.asset,
+            "is_buy": spec.side == MarketSide.LONG,
+            "sz": quantity,
+            "limit_px": price,
+            "order_type": {
+                "limit": {
+                    "tif": "Ioc" if spec.order_type == OrderType.MARKET else "Gtc"
+                }
+            },
+            "reduce_only": spec.reduce_only
+        }
+    
+    async def place_orders(self, specs: List[OrderSpec]) -> List[Optional[str]]:
+        """
+        Place several orders with one signature and one /exchange call
+        
+        Args:
+            specs: Orders to place
+        
+        Returns:
+            Order ID (or None) for each spec, in order
+        """
+        if not specs:
+            return []
+        
+        try:
+            # Set leverage once per asset before submitting
+            leverage_by_asset = {
+                spec.asset: spec.leverage
+                for spec in specs
+                if spec.leverage and not spec.reduce_only
             }
+            if leverage_by_asset:
+                await asyncio.gather(*(
+                    self.set_leverage(asset, leverage)
+                    for asset, leverage in leverage_by_asset.items()
+                ))
+            
+            orders = await asyncio.gather(*(self._build_order(spec) for spec in specs))
+            if any(order is None for order in orders):
+                return [None] * len(specs)
             
-            # Sign and submit order
-            signed_order = self._sign_l1_action("order", nonce, order_data)
+            # Sign and submit all orders as a single action
+            nonce = self._next_nonce()
+            signed_order = self._sign_l1_action(
+                "order",
+                nonce,
+                {"orders": list(orders), "grouping": "na"}
+            )
             
             response = await self._make_request(
                 "POST",
@@ -437,27 +796,36 @@ class HyperliquidClient:
                 signed_order,
                 signed=True
             )
+            self.invalidate_account_state()
             
-            if response.get("status") == "ok":
-                order_id = response.get("response", {}).get("data", {}).get("statuses", [{}])[0].get("resting", {}).get("oid")
-                
-                bot_logger.info(
-                    f"Placed {side.value} order for {quantity} {asset} at {price} - Order ID: {order_id}",
-                    extra={"trade": True}
-                )
-                return order_id
-            else:
-                bot_logger.error(f"Failed to place order: {response}")
-                return None
+            if response.get("status") != "ok":
+                bot_logger.error(f"Failed to place orders: {response}")
+                return [None] * len(specs)
+            
+            statuses = response.get("response", {}).get("data", {}).get("statuses", [])
+            order_ids = []
+            for i, (spec, order) in enumerate(zip(specs, orders)):
+                status = statuses[i] if i < len(statuses) else {}
+                order_id = (status.get("resting") or status.get("filled") or {}).get("oid")
+                if order_id is None:
+                    bot_logger.error(f"Order for {spec.asset} rejected: {status}")
+                else:
+                    bot_logger.info(
+                        f"Placed {spec.side.value} order for {order['sz']} {spec.asset} at {order['limit_px']} - Order ID: {order_id}",
+                        extra={"trade": True}
+                    )
+                order_ids.append(order_id)
+            
+            return order_ids
                 
         except Exception as e:
-            bot_logger.error(f"Error placing order: {e}")
-            return None
+            bot_logger.error(f"Error placing orders: {e}")
+            return [None] * len(specs)
     
     async def cancel_order(self, asset: str, order_id: str) -> bool:
         """Cancel an open order"""
         try:
-            nonce = int(time.time() * 1000)
+            nonce = self._next_nonce()
             
             cancel_data = {
                 "coin": asset,
@@ -472,6 +840,7 @@ class HyperliquidClient:
                 signed_cancel,
                 signed=True
             )
+            self.invalidate_account_state()
             
             if response.get("status") == "ok":
                 bot_logger.info(f"Cancelled order: {order_id}")
@@ -484,42 +853,32 @@ class HyperliquidClient:
     
     async def get_positions(self) -> List[Dict[str, Any]]:
         """Get all open positions"""
-        try:
-            state = await self.get_account_state()
-            positions = state.get("assetPositions", [])
-            
-            formatted_positions = []
-            for i, pos in enumerate(positions):
-                if pos.get("position", {}).get("szi", "0") != "0":
-                    formatted_positions.append({
-                        "coin": state.get("assets", [])[i].get("name"),
-                        "size": Decimal(pos["position"]["szi"]),
-                        "entry_price": Decimal(pos["position"]["entryPx"]),
-                        "unrealized_pnl": Decimal(pos["position"]["unrealizedPnl"]),
-                        "margin_used": Decimal(pos["position"]["marginUsed"]),
-                        "leverage": int(Decimal(pos["position"]["leverage"]))
-                    })
-            
-            return formatted_positions
-            
-        except Exception as e:
-            bot_logger.error(f"Error getting positions: {e}")
-            return []
+        state = await self.get_account_state()
+        positions = state.get("assetPositions", [])
+        
+        formatted_positions = []
+        for i, pos in enumerate(positions):
+            if pos.get("position", {}).get("szi", "0") != "0":
+                formatted_positions.append({
+                    "coin": state.get("assets", [])[i].get("name"),
+                    "size": Decimal(pos["position"]["szi"]),
+                    "entry_price": Decimal(pos["position"]["entryPx"]),
+                    "unrealized_pnl": Decimal(pos["position"]["unrealizedPnl"]),
+                    "margin_used": Decimal(pos["position"]["marginUsed"]),
+                    "leverage": int(Decimal(pos["position"]["leverage"]))
+                })
+        
+        return formatted_positions
     
     async def get_balance(self) -> Decimal:
         """Get account balance in USD"""
-        try:
-            state = await self.get_account_state()
-            
-            # Get total account value
-            account_value = Decimal(state.get("clearinghouseState", {}).get("marginSummary", {}).get("accountValue", "0"))
-            
-            bot_logger.info(f"Account balance: ${account_value:.2f}")
-            return account_value
-            
-        except Exception as e:
-            bot_logger.error(f"Error getting balance: {e}")
-            return Decimal(0)
+        state = await self.get_account_state()
+        
+        # Get total account value
+        account_value = Decimal(state.get("clearinghouseState", {}).get("marginSummary", {}).get("accountValue", "0"))
+        
+        bot_logger.info(f"Account balance: ${account_value:.2f}")
+        return account_value
     
     async def set_leverage(self, asset: str, leverage: int) -> bool:
         """
@@ -537,7 +896,7 @@ class HyperliquidClient:
                 bot_logger.error(f"Invalid leverage: {leverage} (must be 1-50)")
                 return False
             
-            nonce = int(time.time() * 1000)
+            nonce = self._next_nonce()
             
             leverage_data = {
                 "coin": asset,
@@ -553,6 +912,7 @@ class HyperliquidClient:
                 signed_action,
                 signed=True
             )
+            self.invalidate_account_state()
             
             if response.get("status") == "ok":
                 bot_logger.info(f"Set leverage to {leverage}x for {asset}")
@@ -565,22 +925,17 @@ class HyperliquidClient:
     
     async def get_funding_rate(self, asset: str) -> Decimal:
         """Get current funding rate for an asset"""
-        return self.funding_rates.get(asset, Decimal(0))
+        return self.funding_rates.get(asset, _ZERO)
     
     async def get_open_orders(self, asset: Optional[str] = None) -> List[Dict]:
         """Get all open orders"""
-        try:
-            state = await self.get_account_state()
-            orders = state.get("clearinghouseState", {}).get("openOrders", [])
-            
-            if asset:
-                orders = [o for o in orders if o.get("coin") == asset]
-            
-            return orders
-            
-        except Exception as e:
-            bot_logger.error(f"Error getting open orders: {e}")
-            return []
+        state = await self.get_account_state()
+        orders = state.get("clearinghouseState", {}).get("openOrders", [])
+        
+        if asset:
+            orders = [o for o in orders if o.get("coin") == asset]
+        
+        return orders
     
     async def close_position(self, asset: str) -> bool:
         """
@@ -592,32 +947,27 @@ class HyperliquidClient:
         Returns:
             Success status
         """
-        try:
-            positions = await self.get_positions()
-            
-            for pos in positions:
-                if pos["coin"] == asset and pos["size"] != 0:
-                    # Determine side to close position
-                    close_side = MarketSide.SHORT if pos["size"] > 0 else MarketSide.LONG
-                    
-                    # Place market order to close
-                    order_id = await self.place_order(
-                        asset=asset,
-                        side=close_side,
-                        order_type=OrderType.MARKET,
-                        quantity=abs(pos["size"]),
-                        reduce_only=True
-                    )
-                    
-                    if order_id:
-                        bot_logger.info(f"Closed position for {asset}")
-                        return True
-            
-            return False
-            
-        except Exception as e:
-            bot_logger.error(f"Error closing position: {e}")
-            return False
+        positions = await self.get_positions()
+        
+        for pos in positions:
+            if pos["coin"] == asset and pos["size"] != 0:
+                # Determine side to close position
+                close_side = MarketSide.SHORT if pos["size"] > 0 else MarketSide.LONG
+                
+                # Place market order to close
+                order_id = await self.place_order(
+                    asset=asset,
+                    side=close_side,
+                    order_type=OrderType.MARKET,
+                    quantity=abs(pos["size"]),
+                    reduce_only=True
+                )
+                
+                if order_id:
+                    bot_logger.info(f"Closed position for {asset}")
+                    return True
+        
+        return False
     
     async def subscribe_to_market_data(self, assets: List[str], callback):
         """
@@ -627,39 +977,49 @@ class HyperliquidClient:
             assets: List of assets to subscribe to
             callback: Async callback function for updates
         """
+        if not self.session:
+            self.session = self._create_session()
+        
         try:
-            async with websockets.connect(self.ws_url) as websocket:
+            # aiohttp's C-accelerated frame reader. permessage-deflate shrinks
+            # the JSON book/trade frames several-fold; disable it to compare
+            # decompression CPU against bandwidth when profiling
+            compress = 15 if config.HYPERLIQUID_WS_COMPRESSION else 0
+            async with self.session.ws_connect(self.ws_url, compress=compress, heartbeat=30) as websocket:
                 self.ws = websocket
                 
-                # Subscribe to each asset
-                for asset in assets:
-                    subscribe_msg = {
+                # Hyperliquid takes one subscription per message; encode them
+                # all up front and write the frames back to back
+                subscriptions = [
+                    orjson.dumps({
                         "method": "subscribe",
                         "subscription": {
-                            "type": "l2Book",
+                            "type": channel,
                             "coin": asset
                         }
-                    }
-                    await websocket.send(json.dumps(subscribe_msg))
-                    
-                    # Also subscribe to trades
-                    trades_msg = {
-                        "method": "subscribe",
-                        "subscription": {
-                            "type": "trades",
-                            "coin": asset
-                        }
-                    }
-                    await websocket.send(json.dumps(trades_msg))
+                    }).decode()
+                    for asset in assets
+                    for channel in ("l2Book", "trades")
+                ]
+                await asyncio.gather(*(websocket.send_str(message) for message in subscriptions))
                 
                 # Listen for updates
                 async for message in websocket:
-                    data = json.loads(message)
+                    if message.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        break
+                    data = orjson.loads(message.data)
+                    self._update_top_of_book(data)
                     await callback(data)
                     
         except Exception as e:
             bot_logger.error(f"WebSocket error: {e}")
+        finally:
+            # Nothing keeps the cached books current once the socket is gone
             self.ws = None
+            self._top_of_book.clear()
+    
+    # Hyperliquid maintenance margin is 0.6%
+    MAINTENANCE_MARGIN = 0.006
     
     def calculate_liquidation_price(
         self,
@@ -678,35 +1038,50 @@ class HyperliquidClient:
         Returns:
             Liquidation price
         """
-        # Hyperliquid maintenance margin is 0.6%
-        maintenance_margin = Decimal("0.006")
+        liquidation_prices = self.calculate_liquidation_prices(
+            np.array([float(entry_price)]),
+            np.array([side == MarketSide.LONG]),
+            np.array([leverage])
+        )
+        return Decimal(repr(float(liquidation_prices[0])))
+    
+    @classmethod
+    def calculate_liquidation_prices(
+        cls,
+        entry_prices: np.ndarray,
+        is_long: np.ndarray,
+        leverages: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate liquidation prices for many positions at once
+        
+        Args:
+            entry_prices: Entry prices
+            is_long: True for long positions, False for short
+            leverages: Position leverages
         
-        if side == MarketSide.LONG:
-            # Long liquidation
-            liquidation_price = entry_price * (1 - (1 - maintenance_margin) / leverage)
-        else:
-            # Short liquidation
-            liquidation_price = entry_price * (1 + (1 - maintenance_margin) / leverage)
+        Returns:
+            float64 array of liquidation prices
+        """
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        leverages = np.asarray(leverages, dtype=np.float64)
         
-        return liquidation_price
+        # Longs liquidate below entry, shorts above
+        sign = np.where(np.asarray(is_long, dtype=bool), -1.0, 1.0)
+        return entry_prices * (1.0 + sign * (1.0 - cls.MAINTENANCE_MARGIN) / leverages)
     
     async def get_historical_funding(self, asset: str, days: int = 7) -> List[Dict]:
         """Get historical funding rates"""
-        try:
-            start_time = int((time.time() - (days * 86400)) * 1000)
-            
-            response = await self._make_request(
-                "POST",
-                "/info",
-                {
-                    "type": "fundingHistory",
-                    "coin": asset,
-                    "startTime": start_time
-                }
-            )
-            
-            return response
-            
-        except Exception as e:
-            bot_logger.error(f"Error getting funding history: {e}")
-            return []
+        start_time = int((time.time() - (days * 86400)) * 1000)
+        
+        response = await self._make_request(
+            "POST",
+            "/info",
+            {
+                "type": "fundingHistory",
+                "coin": asset,
+                "startTime": start_time
+            }
+        )
+        
+        return response
@@ -2,17 +2,28 @@
 Polymarket client for interacting with the prediction market
 """
 import asyncio
+import heapq
+import itertools
 import json
-from typing import Optional, List, Dict, Any
+import random
+import re
+import time
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
 import aiohttp
+import orjson
 from web3 import Web3
+from eth_abi import decode as abi_decode
 from eth_account import Account
 from py_clob_client.client import ClobClient
 from py_clob_client.order_builder.constants import BUY, SELL
-from gql import gql, Client
-from gql.transport.aiohttp import AIOHTTPTransport
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:  # stdlib parser handles the ISO-8601 forms Gamma emits
+    _parse_iso_datetime = datetime.fromisoformat
 
 from src.models import (
     PolymarketMarket, 
@@ -24,6 +35,73 @@ from src.config import config
 from src.utils.logger import bot_logger
 
 
+# Transient failures worth retrying / serving stale data for
+_TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+# Failures of a market listing refresh (ConnectionError: no first page,
+# ValueError: undecodable body)
+_FETCH_ERRORS = _TRANSIENT_ERRORS + (ConnectionError, ValueError)
+
+# Malformed market payloads; pydantic's ValidationError is a ValueError and
+# decimal.InvalidOperation an ArithmeticError
+_PARSE_ERRORS = (KeyError, IndexError, TypeError, ValueError, ArithmeticError)
+
+# Default expiry horizon when a market omits its end date
+_ONE_DAY = timedelta(days=1)
+
+# Naive UTC epoch; expiries are compared against datetime.utcnow()
+_EPOCH = datetime(1970, 1, 1)
+
+# Target price in a market question, e.g. "$65,000" or "3500.5"
+_PRICE_RE = re.compile(r'\$?([\d,]+(?:\.\d+)?)')
+
+# Lowercase question keywords marking a price-prediction market
+_MARKET_KEYWORDS = ("up", "down", "above", "below", "price", "$")
+
+# Alternation over the keywords
+_MARKET_KEYWORD_PATTERN = "|".join(map(re.escape, _MARKET_KEYWORDS))
+
+
+@lru_cache(maxsize=None)
+def _market_filter_re(asset: str) -> re.Pattern:
+    """
+    Case-insensitive pattern matching a question that contains the asset
+    and at least one keyword as substrings, anywhere and in either order
+    (so "eth" matches "Ethereum"), in one compiled search
+    """
+    return re.compile(
+        rf"\A(?=.*?{re.escape(asset)})(?=.*?(?:{_MARKET_KEYWORD_PATTERN}))",
+        re.IGNORECASE | re.DOTALL
+    )
+
+
+def _level_price(level: Dict[str, Any]) -> float:
+    """Sort key for raw CLOB levels"""
+    return float(level["price"])
+
+
+@lru_cache(maxsize=8192)
+def _decimal_from_str(value: str) -> Decimal:
+    """Memoized Decimal parse; CLOB prices and sizes recur on a tick grid"""
+    return Decimal(value)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a CLOB/Gamma numeric field (str or number) to Decimal"""
+    return _decimal_from_str(value if type(value) is str else str(value))
+
+
+@lru_cache(maxsize=1024)
+def _half_decimal_from_str(value: str) -> Decimal:
+    """Memoized half of a Decimal value, for the up/down liquidity split"""
+    return _decimal_from_str(value) / 2
+
+
+def _half_decimal(value: Any) -> Decimal:
+    """Half of a numeric field as Decimal"""
+    return _half_decimal_from_str(value if type(value) is str else str(value))
+
+
 class PolymarketClient:
     """Client for interacting with Polymarket"""
     
@@ -33,6 +111,60 @@ class PolymarketClient:
     STRAPI_API_URL = "https://strapi-matic.poly.market"
     GRAPHQL_URL = "https://api.thegraph.com/subgraphs/name/polymarket/matic-markets"
     
+    # USDC on Polygon (6 decimals)
+    USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+    USDC_ABI = [
+        {
+            "constant": True,
+            "inputs": [{"name": "_owner", "type": "address"}],
+            "name": "balanceOf",
+            "outputs": [{"name": "balance", "type": "uint256"}],
+            "type": "function"
+        }
+    ]
+    
+    # Multicall3 (same address on every EVM chain); only aggregate3 is used
+    MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+    MULTICALL3_ABI = [
+        {
+            "inputs": [
+                {
+                    "components": [
+                        {"name": "target", "type": "address"},
+                        {"name": "allowFailure", "type": "bool"},
+                        {"name": "callData", "type": "bytes"}
+                    ],
+                    "name": "calls",
+                    "type": "tuple[]"
+                }
+            ],
+            "name": "aggregate3",
+            "outputs": [
+                {
+                    "components": [
+                        {"name": "success", "type": "bool"},
+                        {"name": "returnData", "type": "bytes"}
+                    ],
+                    "name": "returnData",
+                    "type": "tuple[]"
+                }
+            ],
+            "stateMutability": "payable",
+            "type": "function"
+        }
+    ]
+    
+    # Gamma /markets pagination: page size, pages fetched per wave, page cap
+    MARKETS_PAGE_SIZE = 100
+    MARKETS_PAGE_CONCURRENCY = 10
+    MARKETS_MAX_PAGES = 50
+    
+    # Extra attempts for requests rate limited (HTTP 429) or failing in transit
+    REQUEST_RETRIES = 3
+    
+    # Seconds a per-asset market listing is served from cache
+    MARKETS_CACHE_TTL = 15.0
+    
     def __init__(self):
         """Initialize Polymarket client"""
         self.api_key = config.POLYMARKET_API_KEY
@@ -45,6 +177,22 @@ class PolymarketClient:
         self.account = Account.from_key(self.private_key)
         self.address = self.account.address
         
+        # On-chain reads are aggregated into a single eth_call
+        self._multicall = self.w3.eth.contract(
+            address=Web3.to_checksum_address(self.MULTICALL3_ADDRESS),
+            abi=self.MULTICALL3_ABI
+        )
+        
+        # USDC contract and the encoded balanceOf(self) read, built once
+        self._usdc = self.w3.eth.contract(
+            address=Web3.to_checksum_address(self.USDC_ADDRESS),
+            abi=self.USDC_ABI
+        )
+        self._usdc_balance_call = (
+            self._usdc.address,
+            self._usdc.encode_abi("balanceOf", args=[self.address])
+        )
+        
         # Initialize CLOB client (updated for new py-clob-client API)
         self.clob_client = ClobClient(
             host=self.CLOB_API_URL,
@@ -52,23 +200,128 @@ class PolymarketClient:
             chain_id=self.chain_id
         )
         
-        # GraphQL client for market data (deprecated - keeping for legacy functions)
-        # transport = AIOHTTPTransport(url=self.GRAPHQL_URL)
-        # self.gql_client = Client(transport=transport, fetch_schema_from_transport=True)
-
         self.session: Optional[aiohttp.ClientSession] = None
         
+        # Caps in-flight Gamma/CLOB requests to stay clear of 429s
+        self._sem = asyncio.Semaphore(config.POLYMARKET_MAX_CONCURRENCY)
+        
+        # asset -> (fetch time, markets), with a lock per asset so concurrent
+        # callers share one refresh
+        self._markets_cache: Dict[str, Tuple[float, List[PolymarketMarket]]] = {}
+        self._markets_locks: Dict[str, asyncio.Lock] = {}
+        
+        # (market id, "UP"/"DOWN") -> CLOB outcome token id
+        self._token_cache: Dict[Tuple[str, str], str] = {}
+        
         bot_logger.info(f"Initialized Polymarket client for address: {self.address}")
     
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Create a keep-alive session shared by all Gamma/CLOB REST calls"""
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
+        return aiohttp.ClientSession(connector=connector)
+    
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the client session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+        return self.session
+    
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        self._ensure_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session:
             await self.session.close()
+            self.session = None
+    
+    @cached_property
+    def gql_client(self):
+        """
+        GraphQL client for the legacy subgraph, built on first use
+        
+        gql is imported here so only monitor_market_resolution pays its
+        import cost.
+        """
+        from gql import Client
+        from gql.transport.aiohttp import AIOHTTPTransport
+        
+        transport = AIOHTTPTransport(url=self.GRAPHQL_URL)
+        return Client(transport=transport, fetch_schema_from_transport=True)
+    
+    @cached_property
+    def _resolution_query(self):
+        """Parsed market resolution query"""
+        from gql import gql
+        
+        return gql("""
+            query GetMarketResolution($id: ID!) {
+                market(id: $id) {
+                    resolved
+                    resolvedOutcome
+                }
+            }
+        """)
+    
+    async def _clob(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking py_clob_client call in a worker thread
+        
+        py_clob_client is requests-based; calling it directly from a
+        coroutine would stall the event loop for the whole round-trip.
+        """
+        async with self._sem:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+    
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        GET a JSON resource, bounded by the client semaphore
+        
+        HTTP 429 responses are retried with exponential backoff, honouring
+        Retry-After when the server sends it; connection errors and timeouts
+        are retried with jittered backoff and re-raised once exhausted.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+        
+        Returns:
+            Decoded JSON, or None on HTTP failure
+        """
+        session = self._ensure_session()
+        
+        for attempt in range(self.REQUEST_RETRIES + 1):
+            try:
+                async with self._sem:
+                    async with session.get(url, params=params) as response:
+                        if response.status == 200:
+                            return orjson.loads(await response.read())
+                        
+                        if response.status != 429 or attempt == self.REQUEST_RETRIES:
+                            bot_logger.error(f"GET {url} failed: HTTP {response.status}")
+                            return None
+                        
+                        retry_after = response.headers.get("Retry-After", "")
+                        delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt
+                        
+            except _TRANSIENT_ERRORS as e:
+                if attempt == self.REQUEST_RETRIES:
+                    raise
+                delay = 0.1 * 2 ** attempt + random.uniform(0, 0.1)
+                bot_logger.debug(f"GET {url} failed ({e}), retrying in {delay:.2f}s")
+            
+            # Back off outside the semaphore so other requests can proceed
+            await asyncio.sleep(delay)
+        
+        return None
     
     async def get_markets_by_asset(self, asset: str = "BTC") -> List[PolymarketMarket]:
         """
@@ -79,54 +332,165 @@ class PolymarketClient:
 
         Returns:
             List of Polymarket markets
+
+        Listings are cached per asset for MARKETS_CACHE_TTL seconds;
+        concurrent callers share one fetch, and the last good listing is
+        returned if Gamma is unavailable.
         """
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+        cached = self._markets_cache.get(asset)
+        if cached and time.time() - cached[0] < self.MARKETS_CACHE_TTL:
+            return cached[1]
 
-            # Use Gamma API for market data
-            url = f"{self.GAMMA_API_URL}/markets"
+        async with self._markets_locks.setdefault(asset, asyncio.Lock()):
+            # Another caller may have refreshed while we waited
+            cached = self._markets_cache.get(asset)
+            if cached and time.time() - cached[0] < self.MARKETS_CACHE_TTL:
+                return cached[1]
 
-            params = {
-                "active": "true",
-                "limit": 100,
-                "offset": 0
-            }
+            try:
+                self._ensure_session()
 
-            async with self.session.get(url, params=params) as response:
-                if response.status != 200:
-                    bot_logger.error(f"Failed to fetch markets: HTTP {response.status}")
-                    return []
-
-                data = await response.json()
                 markets = []
 
-                # Filter for markets containing the asset
-                for market_data in data:
-                    question = market_data.get("question", "").lower()
+                # Look for price prediction markets for this asset
+                # A configured tag narrows the listing server-side; the
+                # question filter still applies to whatever comes back
+                tag_id = config.POLYMARKET_TAG_IDS.get(asset)
+                market_filter = _market_filter_re(asset)
+                matching, complete = await self._fetch_active_markets(
+                    lambda market_data: market_filter.search(market_data.get("question", "")) is not None,
+                    {"tag_id": tag_id} if tag_id is not None else None
+                )
+                for market_data in matching:
+                    market = self._parse_rest_market_data(market_data, asset)
+                    if market:
+                        markets.append(market)
 
-                    # Look for price prediction markets for this asset
-                    if asset.lower() in question:
-                        if any(kw in question for kw in ["up", "down", "above", "below", "price", "$"]):
-                            market = self._parse_rest_market_data(market_data, asset)
-                            if market:
-                                markets.append(market)
+                if not complete:
+                    # Never cache a truncated listing as fresh; prefer the
+                    # last full one and only fall back to the partial result
+                    if cached:
+                        bot_logger.warning(
+                            f"Incomplete markets listing, serving {asset} listing from {time.time() - cached[0]:.0f}s ago"
+                        )
+                        return cached[1]
+                    bot_logger.warning(f"Incomplete markets listing, using {len(markets)} {asset} markets uncached")
+                    return markets
 
                 bot_logger.info(f"Found {len(markets)} active {asset} markets")
+                self._markets_cache[asset] = (time.time(), markets)
                 return markets
 
-        except Exception as e:
-            bot_logger.error(f"Error fetching markets: {e}")
-            return []
+            except _FETCH_ERRORS as e:
+                if cached:
+                    bot_logger.warning(
+                        f"Error fetching markets, serving {asset} listing from {time.time() - cached[0]:.0f}s ago: {e}"
+                    )
+                    return cached[1]
+                bot_logger.error(f"Error fetching markets: {e}")
+                return []
+
+    async def _fetch_markets_page(
+        self,
+        offset: int,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Fetch one page of open markets from the Gamma API
+
+        Args:
+            offset: Pagination offset
+            filters: Extra Gamma query filters (e.g. tag_id)
+
+        Returns:
+            Raw market dicts, or None on HTTP failure
+        """
+        params = {
+            "active": "true",
+            "closed": "false",
+            "limit": self.MARKETS_PAGE_SIZE,
+            "offset": offset,
+            **(filters or {})
+        }
+
+        return await self._get_json(f"{self.GAMMA_API_URL}/markets", params)
+
+    async def _fetch_active_markets(
+        self,
+        keep: Optional[Callable[[Dict], bool]] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict], bool]:
+        """
+        Fetch all active markets, requesting pages concurrently
+
+        Gamma does not report a total count, so pages are fetched in waves
+        of MARKETS_PAGE_CONCURRENCY until a successful short page marks the
+        end. A page that still fails after retries stops the sweep and marks
+        the listing incomplete.
+
+        Args:
+            keep: Predicate applied as each wave arrives; rejected markets
+                are dropped with their page instead of accumulating
+            filters: Extra Gamma query filters applied server-side
+
+        Returns:
+            Tuple of (raw market dicts across the fetched pages, whether
+            the listing is complete)
+
+        Raises:
+            ConnectionError: If the first page could not be fetched
+        """
+        pages: List[List[Dict]] = []
+
+        for first_page in range(0, self.MARKETS_MAX_PAGES, self.MARKETS_PAGE_CONCURRENCY):
+            last_page = min(first_page + self.MARKETS_PAGE_CONCURRENCY, self.MARKETS_MAX_PAGES)
+            results = await asyncio.gather(
+                *(
+                    self._fetch_markets_page(page * self.MARKETS_PAGE_SIZE, filters)
+                    for page in range(first_page, last_page)
+                ),
+                return_exceptions=True
+            )
+
+            wave = []
+            for result in results:
+                if isinstance(result, Exception):
+                    bot_logger.error(f"Error fetching markets page: {result}")
+                    result = None
+                wave.append(result)
+
+            # Without the first page there is no listing to serve
+            if first_page == 0 and wave[0] is None:
+                raise ConnectionError("Gamma markets listing unavailable")
+
+            # Keep pages up to the end of the listing or the first failure,
+            # whichever comes first; only reaching the end is complete
+            end, complete, last_wave = len(wave), True, False
+            for i, page in enumerate(wave):
+                if page is None:
+                    end, complete, last_wave = i, False, True
+                    break
+                if len(page) < self.MARKETS_PAGE_SIZE:
+                    end, last_wave = i + 1, True
+                    break
+            wave = wave[:end]
+
+            if keep is not None:
+                wave = [[market for market in page if keep(market)] for page in wave]
+            pages.extend(wave)
+
+            if last_wave:
+                return list(itertools.chain.from_iterable(pages)), complete
+
+        return list(itertools.chain.from_iterable(pages)), True
 
     def _parse_rest_market_data(self, data: Dict, asset: str) -> Optional[PolymarketMarket]:
         """Parse REST API market data into PolymarketMarket model"""
         try:
-            import re
             question = data.get("question", "")
 
             # Extract target price from question
-            price_match = re.search(r'\$?([\d,]+(?:\.\d+)?)', question)
+            price_match = _PRICE_RE.search(question)
             if not price_match:
                 return None
 
@@ -143,33 +507,43 @@ class PolymarketClient:
             down_idx = 1 - up_idx
 
             # Get current prices
-            up_price = Decimal(str(tokens[up_idx].get("price", "0.5")))
-            down_price = Decimal(str(tokens[down_idx].get("price", "0.5")))
+            up_price = _to_decimal(tokens[up_idx].get("price", "0.5"))
+            down_price = _to_decimal(tokens[down_idx].get("price", "0.5"))
 
             # Parse expiry
             end_date = data.get("endDate", data.get("end_date_iso"))
             if end_date:
-                from dateutil import parser
-                expiry_time = parser.parse(end_date)
+                expiry_time = _parse_iso_datetime(end_date)
             else:
-                expiry_time = datetime.utcnow() + timedelta(days=1)
+                expiry_time = datetime.utcnow() + _ONE_DAY
+
+            side_liquidity = _half_decimal(data.get("liquidity", 0))
+            volume = _to_decimal(data.get("volume", 0))
+
+            # Remember the CLOB token ids so order paths skip a lookup
+            market_id = data.get("condition_id", data.get("id"))
+            up_token = tokens[up_idx].get("token_id")
+            down_token = tokens[down_idx].get("token_id")
+            if up_token and down_token:
+                self._token_cache[(market_id, MarketSide.UP.value)] = up_token
+                self._token_cache[(market_id, MarketSide.DOWN.value)] = down_token
 
             return PolymarketMarket(
-                market_id=data.get("condition_id", data.get("id")),
+                market_id=market_id,
                 question=question,
                 asset=asset,
                 target_price=target_price,
                 expiry_time=expiry_time,
                 up_price=up_price,
                 down_price=down_price,
-                up_liquidity=Decimal(str(data.get("liquidity", 0))) / 2,
-                down_liquidity=Decimal(str(data.get("liquidity", 0))) / 2,
-                volume_24h=Decimal(str(data.get("volume", 0))),
-                open_interest=Decimal(str(data.get("volume", 0)))
+                up_liquidity=side_liquidity,
+                down_liquidity=side_liquidity,
+                volume_24h=volume,
+                open_interest=volume
             )
 
-        except Exception as e:
-            bot_logger.debug(f"Failed to parse market: {e}")
+        except _PARSE_ERRORS as e:
+            bot_logger.debug(f"Failed to parse market: {e}", exc_info=True)
             return None
     
     def _parse_market_data(self, data: Dict, asset: str) -> Optional[PolymarketMarket]:
@@ -181,8 +555,7 @@ class PolymarketClient:
                 return None
             
             # Parse target price (this is simplified - you'd need better parsing)
-            import re
-            price_match = re.search(r'\$?([\d,]+(?:\.\d+)?)', question)
+            price_match = _PRICE_RE.search(question)
             if not price_match:
                 return None
             
@@ -203,7 +576,7 @@ class PolymarketClient:
                 question=question,
                 asset=asset,
                 target_price=target_price,
-                expiry_time=datetime.fromtimestamp(int(data["endTime"])),
+                expiry_time=_EPOCH + timedelta(seconds=int(data["endTime"])),
                 up_price=Decimal(outcome_prices[up_idx]),
                 down_price=Decimal(outcome_prices[down_idx]),
                 up_liquidity=Decimal(data["liquidityUSD"]) / 2,  # Simplified
@@ -212,17 +585,23 @@ class PolymarketClient:
                 open_interest=Decimal(data["openInterestUSD"])
             )
             
-        except Exception as e:
-            bot_logger.warning(f"Failed to parse market data: {e}")
+        except _PARSE_ERRORS as e:
+            bot_logger.warning(f"Failed to parse market data: {e}", exc_info=True)
             return None
     
-    async def get_order_book(self, market_id: str, outcome: str = "UP") -> Dict[str, List[PriceLevel]]:
+    async def get_order_book(
+        self,
+        market_id: str,
+        outcome: str = "UP",
+        depth: Optional[int] = None
+    ) -> Dict[str, List[PriceLevel]]:
         """
         Get order book for a specific market outcome
         
         Args:
             market_id: Polymarket market ID
             outcome: "UP" or "DOWN"
+            depth: Best levels to keep per side (best first); all if None
         
         Returns:
             Dictionary with 'bids' and 'asks' price levels
@@ -230,36 +609,88 @@ class PolymarketClient:
         try:
             # Get order book from CLOB API
             outcome_token = self._get_outcome_token(market_id, outcome)
-            order_book = self.clob_client.get_order_book(outcome_token)
-            
-            # Parse order book
-            bids = [
-                PriceLevel(
-                    price=Decimal(str(bid["price"])),
-                    quantity=Decimal(str(bid["size"]))
-                )
-                for bid in order_book.get("bids", [])
-            ]
-            
-            asks = [
-                PriceLevel(
-                    price=Decimal(str(ask["price"])),
-                    quantity=Decimal(str(ask["size"]))
-                )
-                for ask in order_book.get("asks", [])
-            ]
-            
-            return {"bids": bids, "asks": asks}
+            order_book = await self._clob(self.clob_client.get_order_book, outcome_token)
+            return self._parse_book(order_book, depth)
             
         except Exception as e:
             bot_logger.error(f"Error fetching order book: {e}")
             return {"bids": [], "asks": []}
     
+    async def get_order_books(
+        self,
+        market_ids: List[str],
+        outcome: str = "UP"
+    ) -> Dict[str, Dict[str, List[PriceLevel]]]:
+        """
+        Get order books for several markets concurrently
+        
+        Args:
+            market_ids: Polymarket market IDs
+            outcome: "UP" or "DOWN"
+        
+        Returns:
+            Market ID -> dictionary with 'bids' and 'asks' price levels
+        """
+        books = await asyncio.gather(
+            *(
+                self._clob(self.clob_client.get_order_book, self._get_outcome_token(market_id, outcome))
+                for market_id in market_ids
+            ),
+            return_exceptions=True
+        )
+        
+        order_books = {}
+        for market_id, book in zip(market_ids, books):
+            if isinstance(book, Exception):
+                bot_logger.error(f"Error fetching order book for {market_id}: {book}")
+                order_books[market_id] = {"bids": [], "asks": []}
+            else:
+                order_books[market_id] = self._parse_book(book)
+        return order_books
+    
+    @staticmethod
+    def _parse_book(order_book: Dict[str, Any], depth: Optional[int] = None) -> Dict[str, List[PriceLevel]]:
+        """
+        Convert a CLOB order book response into PriceLevel lists
+        
+        With a depth, only the best levels per side are selected (on the
+        raw price strings) before any Decimal/PriceLevel is built.
+        """
+        raw_bids = order_book.get("bids", [])
+        raw_asks = order_book.get("asks", [])
+        if depth is not None:
+            raw_bids = heapq.nlargest(depth, raw_bids, key=_level_price)
+            raw_asks = heapq.nsmallest(depth, raw_asks, key=_level_price)
+        
+        bids = [
+            PriceLevel(
+                price=_to_decimal(bid["price"]),
+                quantity=_to_decimal(bid["size"])
+            )
+            for bid in raw_bids
+        ]
+        
+        asks = [
+            PriceLevel(
+                price=_to_decimal(ask["price"]),
+                quantity=_to_decimal(ask["size"])
+            )
+            for ask in raw_asks
+        ]
+        
+        return {"bids": bids, "asks": asks}
+    
     def _get_outcome_token(self, market_id: str, outcome: str) -> str:
         """Get outcome token address for a market"""
-        # This would need proper implementation based on Polymarket's structure
-        # For now, returning a placeholder
-        return f"{market_id}_{outcome}"
+        token = self._token_cache.get((market_id, outcome))
+        if token is not None:
+            return token
+        
+        # Markets not seen in a Gamma listing have no known token id yet;
+        # fall back to the placeholder and memoize it
+        token = f"{market_id}_{outcome}"
+        self._token_cache[(market_id, outcome)] = token
+        return token
     
     async def place_order(
         self,
@@ -290,7 +721,7 @@ class PolymarketClient:
             # Build order
             if order_type == OrderType.MARKET:
                 # For market orders, use best available price
-                order_book = await self.get_order_book(market_id, side.value)
+                order_book = await self.get_order_book(market_id, side.value, depth=1)
                 if is_buy:
                     if not order_book["asks"]:
                         bot_logger.error("No asks available for market buy")
@@ -313,8 +744,8 @@ class PolymarketClient:
             }
             
             # Sign and submit order
-            signed_order = self.clob_client.create_order(order)
-            result = self.clob_client.post_order(signed_order)
+            signed_order = await self._clob(self.clob_client.create_order, order)
+            result = await self._clob(self.clob_client.post_order, signed_order)
             
             order_id = result.get("orderID")
             if order_id:
@@ -334,7 +765,7 @@ class PolymarketClient:
     async def get_order_status(self, order_id: str) -> Dict[str, Any]:
         """Get status of a specific order"""
         try:
-            return self.clob_client.get_order(order_id)
+            return await self._clob(self.clob_client.get_order, order_id)
         except Exception as e:
             bot_logger.error(f"Error getting order status: {e}")
             return {}
@@ -342,7 +773,7 @@ class PolymarketClient:
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an open order"""
         try:
-            result = self.clob_client.cancel_order(order_id)
+            result = await self._clob(self.clob_client.cancel_order, order_id)
             success = result.get("success", False)
             if success:
                 bot_logger.info(f"Cancelled order: {order_id}")
@@ -354,32 +785,36 @@ class PolymarketClient:
     async def get_positions(self) -> List[Dict[str, Any]]:
         """Get all open positions for the account"""
         try:
-            return self.clob_client.get_orders(self.address, include_filled=False)
+            return await self._clob(self.clob_client.get_orders, self.address, include_filled=False)
         except Exception as e:
             bot_logger.error(f"Error getting positions: {e}")
             return []
     
+    async def batch_reads(self, calls: List[Tuple[str, bytes]]) -> List[Optional[bytes]]:
+        """
+        Execute several contract reads in one eth_call via Multicall3
+        
+        Args:
+            calls: (target address, ABI-encoded calldata) pairs
+        
+        Returns:
+            Raw return data per call, None where the call reverted
+        """
+        results = await asyncio.to_thread(
+            self._multicall.functions.aggregate3(
+                [(target, True, calldata) for target, calldata in calls]
+            ).call
+        )
+        return [return_data if success else None for success, return_data in results]
+    
     async def get_balance(self) -> Decimal:
         """Get account balance in USDC"""
         try:
-            # Get USDC balance on Polygon
-            usdc_address = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"  # USDC on Polygon
-            usdc_abi = [
-                {
-                    "constant": True,
-                    "inputs": [{"name": "_owner", "type": "address"}],
-                    "name": "balanceOf",
-                    "outputs": [{"name": "balance", "type": "uint256"}],
-                    "type": "function"
-                }
-            ]
+            balance_data, = await self.batch_reads([self._usdc_balance_call])
+            if balance_data is None:
+                raise ValueError("balanceOf call reverted")
             
-            usdc_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(usdc_address),
-                abi=usdc_abi
-            )
-            
-            balance_wei = usdc_contract.functions.balanceOf(self.address).call()
+            balance_wei, = abi_decode(["uint256"], balance_data)
             balance = Decimal(balance_wei) / Decimal(10**6)  # USDC has 6 decimals
             
             bot_logger.info(f"Account balance: {balance} USDC")
@@ -401,17 +836,8 @@ class PolymarketClient:
         """
         try:
             # Query for market resolution
-            query = gql("""
-                query GetMarketResolution($id: ID!) {
-                    market(id: $id) {
-                        resolved
-                        resolvedOutcome
-                    }
-                }
-            """)
-            
             variables = {"id": market_id}
-            result = await self.gql_client.execute_async(query, variable_values=variables)
+            result = await self.gql_client.execute_async(self._resolution_query, variable_values=variables)
             
             market = result.get("market", {})
             if market.get("resolved"):
@@ -2,14 +2,17 @@
 Main arbitrage bot orchestrator
 """
 import asyncio
+import logging
 import signal
 import sys
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 from src.config import config
 from src.utils.logger import bot_logger, console, setup_logging
+from src.utils.event_loop import install_uvloop
 from src.models import (
     ArbitrageOpportunity,
     Position,
@@ -31,6 +34,9 @@ from rich.panel import Panel
 class ArbitrageBot:
     """Main arbitrage bot orchestrator"""
     
+    BALANCE_TTL = 60.0  # Seconds between balance checks while idle
+    SHUTDOWN_GRACE = 5.0  # Seconds to wait for cancelled tasks to unwind
+    
     def __init__(
         self,
         assets: List[str] = ["BTC", "ETH"],
@@ -66,6 +72,22 @@ class ArbitrageBot:
         self.opportunities_found = 0
         self.opportunities_executed = 0
         
+        # Next executor.position_history index to fold into metrics; the
+        # history is append-only, so each closed position is counted once
+        self._metrics_cursor = 0
+        
+        # Set by producers whenever opportunities, positions or metrics change
+        self.state_changed = asyncio.Event()
+        
+        # (monotonic timestamp, polymarket, hyperliquid); cleared after each trade
+        self._balance_cache: Optional[Tuple[float, Decimal, Decimal]] = None
+        
+        # Held so the shutdown task is not garbage collected mid-flight
+        self._shutdown_task: Optional[asyncio.Task] = None
+        
+        # Background tasks started by start(); cancelled by shutdown()
+        self._tasks: List[asyncio.Task] = []
+        
         # Notification manager
         self.notifications = NotificationManager() if config.ENABLE_TELEGRAM_ALERTS else None
         
@@ -83,25 +105,48 @@ class ArbitrageBot:
         bot_logger.info("Starting arbitrage bot...")
         self.is_running = True
         
-        # Set up signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Set up signal handlers on the loop so shutdown is scheduled from the loop thread
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._signal_handler, sig)
+            except NotImplementedError:
+                # Windows event loops lack add_signal_handler; hand off from the
+                # Python-level handler to the loop thread instead
+                signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(
+                        self._signal_handler, signal.Signals(signum)
+                    )
+                )
         
         try:
             # Initialize exchange and Polymarket connections
             async with self.polymarket, self.hyperliquid:
+                if self.notifications:
+                    await self.notifications.start()
+                
                 # Start background tasks
-                tasks = [
+                self._tasks = [
                     asyncio.create_task(self._main_loop()),
                     asyncio.create_task(self.executor.monitor_positions()),
                     asyncio.create_task(self._monitor_performance())
                 ]
                 
                 if self.dashboard:
-                    tasks.append(asyncio.create_task(self._update_dashboard()))
+                    self._tasks.append(asyncio.create_task(self._update_dashboard()))
                 
                 # Wait for all tasks
-                await asyncio.gather(*tasks)
+                try:
+                    await asyncio.gather(*self._tasks)
+                except asyncio.CancelledError:
+                    # Expected when shutdown() cancels the tasks; otherwise propagate
+                    if self.is_running:
+                        raise
+                
+                # Let a signal-initiated shutdown finish while connections are open
+                if self._shutdown_task is not None:
+                    await self._shutdown_task
                 
         except Exception as e:
             bot_logger.error(f"Critical error in bot: {e}")
@@ -113,21 +158,26 @@ class ArbitrageBot:
         
         while self.is_running:
             try:
-                # Check account balances
-                await self._check_balances()
-                
-                # Scan for opportunities
+                # Check account balances alongside the opportunity scan
                 bot_logger.info("Scanning for arbitrage opportunities...")
-                opportunities = await self.detector.scan_for_opportunities(self.assets)
+                _, opportunities = await asyncio.gather(
+                    self._check_balances(),
+                    self.detector.scan_for_opportunities(self.assets)
+                )
                 
                 self.opportunities_found += len(opportunities)
+                self.state_changed.set()
                 
                 if opportunities:
                     bot_logger.info(f"Found {len(opportunities)} opportunities")
                     
-                    # Process each opportunity
-                    for opportunity in opportunities[:3]:  # Process top 3
-                        await self._process_opportunity(opportunity)
+                    # Process the top 3 concurrently so quotes don't go stale
+                    # waiting on each other's validation/execution round-trips;
+                    # the executor reserves limits and capital per execution
+                    await asyncio.gather(
+                        *(self._process_opportunity(opp) for opp in opportunities[:3]),
+                        return_exceptions=True
+                    )
                 else:
                     bot_logger.debug("No profitable opportunities found")
                 
@@ -141,8 +191,9 @@ class ArbitrageBot:
     async def _process_opportunity(self, opportunity: ArbitrageOpportunity):
         """Process a single arbitrage opportunity"""
         try:
-            # Log opportunity details
-            self._log_opportunity(opportunity)
+            # Log opportunity details (skip building the table when INFO is off)
+            if bot_logger.isEnabledFor(logging.INFO):
+                self._log_opportunity(opportunity)
             
             # Validate opportunity
             is_valid, warnings = await self.detector.validate_opportunity(opportunity)
@@ -176,6 +227,8 @@ class ArbitrageBot:
                 
                 if position:
                     self.opportunities_executed += 1
+                    self._balance_cache = None
+                    self.state_changed.set()
                     
                     # Send notification
                     if self.notifications:
@@ -217,9 +270,16 @@ class ArbitrageBot:
     
     async def _check_balances(self):
         """Check and log account balances"""
+        cached = self._balance_cache
+        if cached and time.monotonic() - cached[0] < self.BALANCE_TTL:
+            return
+        
         try:
-            pm_balance = await self.polymarket.get_balance()
-            hl_balance = await self.hyperliquid.get_balance()
+            pm_balance, hl_balance = await asyncio.gather(
+                self.polymarket.get_balance(),
+                self.hyperliquid.get_balance()
+            )
+            self._balance_cache = (time.monotonic(), pm_balance, hl_balance)
 
             total_balance = pm_balance + hl_balance
 
@@ -238,14 +298,18 @@ class ArbitrageBot:
     
     async def _monitor_performance(self):
         """Monitor and update performance metrics"""
-        update_interval = 300  # Update every 5 minutes
+        update_interval = 300  # Report at least every 5 minutes
+        position_closed = self.executor.position_closed
         
         while self.is_running:
             try:
-                # Update metrics from closed positions
-                for position in self.executor.position_history:
+                # Update metrics from positions closed since the last pass
+                history = self.executor.position_history
+                for position in history[self._metrics_cursor:]:
                     if position.status == "CLOSED" and position.net_pnl != 0:
                         self.metrics.update_metrics(position)
+                self._metrics_cursor = len(history)
+                self.state_changed.set()
                 
                 # Calculate additional metrics
                 if self.metrics.total_trades > 0:
@@ -261,7 +325,12 @@ class ArbitrageBot:
                         f"Executed: {self.opportunities_executed} ({success_rate:.1%})"
                     )
                 
-                await asyncio.sleep(update_interval)
+                # Wake as soon as the executor closes a position
+                try:
+                    await asyncio.wait_for(position_closed.wait(), timeout=update_interval)
+                except asyncio.TimeoutError:
+                    pass
+                position_closed.clear()
                 
             except Exception as e:
                 bot_logger.error(f"Error monitoring performance: {e}")
@@ -285,22 +354,43 @@ class ArbitrageBot:
                     # Refresh display
                     live.update(self.dashboard.get_layout())
                     
-                    await asyncio.sleep(1)
+                    # Redraw on new data, or every few seconds for ages/timestamps
+                    try:
+                        await asyncio.wait_for(self.state_changed.wait(), timeout=5)
+                    except asyncio.TimeoutError:
+                        pass
+                    self.state_changed.clear()
                     
                 except Exception as e:
                     bot_logger.error(f"Dashboard error: {e}")
                     await asyncio.sleep(5)
     
-    def _signal_handler(self, sig, frame):
-        """Handle shutdown signals"""
-        bot_logger.info(f"Received signal {sig}, shutting down...")
-        asyncio.create_task(self.shutdown())
+    def _signal_handler(self, sig: signal.Signals):
+        """Handle shutdown signals (runs inside the event loop)"""
+        if self._shutdown_task is not None:
+            return
+        bot_logger.info(f"Received signal {sig.name}, shutting down...")
+        self.is_running = False
+        self._shutdown_task = asyncio.create_task(self.shutdown())
     
     async def shutdown(self):
         """Gracefully shutdown the bot"""
         bot_logger.info("Shutting down arbitrage bot...")
         self.is_running = False
         
+        # Cancel background tasks and give them a short grace period to unwind
+        pending = [task for task in self._tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*pending, return_exceptions=True),
+                    timeout=self.SHUTDOWN_GRACE
+                )
+            except asyncio.TimeoutError:
+                bot_logger.warning("Background tasks did not stop within the grace period")
+        
         try:
             # Close all open positions if in live trading
             if self.enable_live_trading:
@@ -313,35 +403,34 @@ class ArbitrageBot:
             # Close connections
             await self.polymarket.__aexit__(None, None, None)
             await self.hyperliquid.close()
+            if self.notifications:
+                await self.notifications.close()
             
         except Exception as e:
             bot_logger.error(f"Error during shutdown: {e}")
         
         bot_logger.info("Bot shutdown complete")
-        sys.exit(0)
     
     def _print_final_report(self):
         """Print final performance report"""
-        console.print("\n[bold cyan]Final Performance Report[/bold cyan]")
-        console.print("=" * 50)
-        
-        table = Table(show_header=False)
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="green")
-        
-        table.add_row("Total Opportunities Found", str(self.opportunities_found))
-        table.add_row("Opportunities Executed", str(self.opportunities_executed))
-        table.add_row("Total Trades", str(self.metrics.total_trades))
-        table.add_row("Winning Trades", str(self.metrics.winning_trades))
-        table.add_row("Losing Trades", str(self.metrics.losing_trades))
-        table.add_row("Win Rate", f"{self.metrics.win_rate:.1%}")
-        table.add_row("Total P&L", f"${self.metrics.total_pnl:.2f}")
-        table.add_row("Best Trade", f"${self.metrics.best_trade:.2f}")
-        table.add_row("Worst Trade", f"${self.metrics.worst_trade:.2f}")
-        table.add_row("Average Trade", f"${self.metrics.average_trade:.2f}")
-        table.add_row("Total Fees Paid", f"${self.metrics.total_fees_paid:.2f}")
-        
-        console.print(table)
+        m = self.metrics
+        report = (
+            "\nFinal Performance Report\n"
+            f"{'=' * 50}\n"
+            f"Total Opportunities Found: {self.opportunities_found}\n"
+            f"Opportunities Executed:    {self.opportunities_executed}\n"
+            f"Total Trades:              {m.total_trades}\n"
+            f"Winning Trades:            {m.winning_trades}\n"
+            f"Losing Trades:             {m.losing_trades}\n"
+            f"Win Rate:                  {m.win_rate:.1%}\n"
+            f"Total P&L:                 ${m.total_pnl:.2f}\n"
+            f"Best Trade:                ${m.best_trade:.2f}\n"
+            f"Worst Trade:               ${m.worst_trade:.2f}\n"
+            f"Average Trade:             ${m.average_trade:.2f}\n"
+            f"Total Fees Paid:           ${m.total_fees_paid:.2f}"
+        )
+        # Plain stderr write: no Rich rendering on a possibly broken terminal at shutdown
+        print(report, file=sys.stderr, flush=True)
 
 
 async def main():
@@ -367,4 +456,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
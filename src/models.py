@@ -2,11 +2,55 @@
 Data models for the arbitrage bot
 """
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, ClassVar, List, NamedTuple, Tuple
 from datetime import datetime
 from decimal import Decimal
-from pydantic import BaseModel, Field, validator
-from dataclasses import dataclass
+from pydantic import BaseModel, Field, PrivateAttr
+from dataclasses import dataclass, field
+import time
+import numpy as np
+import orjson
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _coerce_decimals(obj: Any, names: Tuple[str, ...]):
+    """Convert numeric inputs (float, int, str) to Decimal in place, as pydantic validation did"""
+    for name in names:
+        value = getattr(obj, name)
+        if value is not None and type(value) is not Decimal:
+            object.__setattr__(obj, name, Decimal(str(value)))
+
+
+def _posix(dt: datetime) -> float:
+    """POSIX seconds for a naive UTC datetime (``datetime.timestamp`` would assume local time)"""
+    return (dt - _EPOCH).total_seconds()
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for types it does not encode natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)  # Lossless, unlike float
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def to_json(obj: Any) -> bytes:
+    """
+    Serialize a model (or any structure of models) to JSON bytes
+    
+    Dataclasses, datetimes and enums are encoded natively by orjson; Decimals
+    are written as strings and pydantic models via ``model_dump``.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, default=_json_default)
 
 
 class MarketSide(str, Enum):
@@ -42,7 +86,7 @@ class ArbitrageType(str, Enum):
     OPTIONS_HEDGE = "OPTIONS_HEDGE"
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceLevel:
     """Price level for order book data"""
     price: Decimal
@@ -53,6 +97,87 @@ class PriceLevel:
         return self.price * self.quantity
 
 
+@dataclass(slots=True)
+class FastPriceLevel:
+    """Float price level for hot paths; convert to PriceLevel at boundaries"""
+    price: float
+    quantity: float
+    
+    def to_price_level(self) -> PriceLevel:
+        """Convert to a Decimal PriceLevel"""
+        return PriceLevel(price=Decimal(repr(self.price)), quantity=Decimal(repr(self.quantity)))
+
+
+class OrderBookSnapshot(NamedTuple):
+    """Order book as bid/ask PriceLevel lists"""
+    bids: List[PriceLevel]
+    asks: List[PriceLevel]
+
+
+@dataclass
+class OrderBookArrays:
+    """Order book levels stored as float64 columns"""
+    bids_px: np.ndarray
+    bids_qty: np.ndarray
+    asks_px: np.ndarray
+    asks_qty: np.ndarray
+    
+    def summary(self, depth: int = 5) -> Tuple[float, float, float]:
+        """
+        Reduce the book to headline statistics in one vectorized pass
+        
+        Args:
+            depth: Levels per side counted towards imbalance
+        
+        Returns:
+            Tuple of (mid, microprice, imbalance); zeros for a one-sided book
+        """
+        if not self.bids_px.size or not self.asks_px.size:
+            return 0.0, 0.0, 0.0
+        
+        best_bid = float(self.bids_px[0])
+        best_ask = float(self.asks_px[0])
+        bid_size = float(self.bids_qty[0])
+        ask_size = float(self.asks_qty[0])
+        
+        mid = (best_bid + best_ask) / 2
+        top_size = bid_size + ask_size
+        microprice = (best_bid * ask_size + best_ask * bid_size) / top_size if top_size else mid
+        
+        bid_depth = float(self.bids_qty[:depth].sum())
+        ask_depth = float(self.asks_qty[:depth].sum())
+        total_depth = bid_depth + ask_depth
+        imbalance = (bid_depth - ask_depth) / total_depth if total_depth else 0.0
+        
+        return mid, microprice, imbalance
+    
+    def to_price_levels(self, depth: Optional[int] = None) -> OrderBookSnapshot:
+        """Convert to a Decimal PriceLevel snapshot"""
+        return OrderBookSnapshot(
+            bids=[
+                PriceLevel(price=Decimal(repr(px)), quantity=Decimal(repr(qty)))
+                for px, qty in zip(self.bids_px[:depth].tolist(), self.bids_qty[:depth].tolist())
+            ],
+            asks=[
+                PriceLevel(price=Decimal(repr(px)), quantity=Decimal(repr(qty)))
+                for px, qty in zip(self.asks_px[:depth].tolist(), self.asks_qty[:depth].tolist())
+            ]
+        )
+
+
+@dataclass(slots=True)
+class OrderSpec:
+    """Parameters of a single order for batched submission"""
+    asset: str
+    side: MarketSide
+    order_type: OrderType
+    quantity: Decimal
+    price: Optional[Decimal] = None
+    leverage: Optional[int] = None
+    reduce_only: bool = False
+    post_only: bool = False
+
+
 class PolymarketMarket(BaseModel):
     """Polymarket market data"""
     market_id: str
@@ -67,11 +192,11 @@ class PolymarketMarket(BaseModel):
     volume_24h: Decimal
     open_interest: Decimal
     
-    @validator("up_price", "down_price")
-    def validate_prices(cls, v):
-        if not 0 <= v <= 1:
-            raise ValueError("Polymarket prices must be between 0 and 1")
-        return v
+    # POSIX expiry, precomputed so time-to-expiry is a float subtraction
+    _expiry_ts: float = PrivateAttr(default=0.0)
+    
+    def model_post_init(self, __context: Any):
+        self._expiry_ts = _posix(self.expiry_time)
     
     @property
     def implied_probability_up(self) -> Decimal:
@@ -86,11 +211,15 @@ class PolymarketMarket(BaseModel):
     @property
     def time_to_expiry_hours(self) -> float:
         """Calculate hours until market expiry"""
-        delta = self.expiry_time - datetime.utcnow()
-        return delta.total_seconds() / 3600
+        return (self._expiry_ts - time.time()) / 3600
+    
+    def hours_to_expiry_at(self, now: datetime) -> float:
+        """Calculate hours until market expiry as of ``now``"""
+        return (self.expiry_time - now).total_seconds() / 3600
 
 
-class SpotMarket(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SpotMarket:
     """Spot/Futures market data from CEX"""
     exchange: str
     symbol: str
@@ -98,17 +227,18 @@ class SpotMarket(BaseModel):
     ask: Decimal
     last: Decimal
     volume_24h: Decimal
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
     
-    @property
-    def mid_price(self) -> Decimal:
-        """Calculate mid price"""
-        return (self.bid + self.ask) / 2
+    # Derived once from the quote; snapshots are never re-priced in place
+    mid_price: Decimal = field(init=False, repr=False, compare=False)
+    spread: Decimal = field(init=False, repr=False, compare=False)
     
-    @property
-    def spread(self) -> Decimal:
-        """Calculate bid-ask spread"""
-        return self.ask - self.bid
+    _DECIMAL_FIELDS: ClassVar[Tuple[str, ...]] = ("bid", "ask", "last", "volume_24h")
+    
+    def __post_init__(self):
+        _coerce_decimals(self, self._DECIMAL_FIELDS)
+        self.mid_price = (self.bid + self.ask) / 2
+        self.spread = self.ask - self.bid
     
     @property
     def spread_percentage(self) -> Decimal:
@@ -118,7 +248,8 @@ class SpotMarket(BaseModel):
         return (self.spread / self.mid_price) * 100
 
 
-class ArbitrageOpportunity(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ArbitrageOpportunity:
     """Detected arbitrage opportunity"""
     opportunity_id: str
     type: ArbitrageType
@@ -146,24 +277,57 @@ class ArbitrageOpportunity(BaseModel):
     sharpe_ratio: Optional[Decimal] = None
     
     # Timing
-    detected_at: datetime = Field(default_factory=datetime.utcnow)
+    detected_at: datetime = field(default_factory=datetime.utcnow)
     expires_at: datetime
+    _expires_at_ts: float = field(init=False, repr=False, compare=False)
+    
+    _DECIMAL_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "polymarket_price", "polymarket_quantity", "hedge_price", "hedge_quantity",
+        "expected_profit_usd", "expected_profit_percentage", "breakeven_price",
+        "max_risk_usd", "probability_of_profit", "sharpe_ratio"
+    )
     
-    @validator("expected_profit_percentage")
-    def validate_profit_percentage(cls, v):
-        if v < -100:
+    def __post_init__(self):
+        _coerce_decimals(self, self._DECIMAL_FIELDS)
+        if self.expected_profit_percentage < -100:
             raise ValueError("Profit percentage cannot be less than -100%")
-        return v
+        self._expires_at_ts = _posix(self.expires_at)
     
     @property
     def time_value(self) -> Decimal:
         """Calculate time value component of the opportunity"""
-        hours_to_expiry = (self.expires_at - datetime.utcnow()).total_seconds() / 3600
+        return self._time_value((self._expires_at_ts - time.time()) / 3600)
+    
+    def time_value_at(self, now: datetime) -> Decimal:
+        """Calculate time value component of the opportunity as of ``now``"""
+        return self._time_value((self.expires_at - now).total_seconds() / 3600)
+    
+    def _time_value(self, hours_to_expiry: float) -> Decimal:
         if hours_to_expiry <= 0:
             return Decimal(0)
         # Simple linear decay model - can be improved
         return self.expected_profit_usd * (Decimal(str(hours_to_expiry)) / 24)
     
+    @classmethod
+    def to_soa(cls, opps: List["ArbitrageOpportunity"]) -> Dict[str, np.ndarray]:
+        """
+        Columnar float64 view of a list of opportunities for vectorized ranking
+        
+        Args:
+            opps: Opportunities to project
+            
+        Returns:
+            Dict of "profit", "prob" and "expiry_sec" (seconds since epoch) arrays
+        """
+        n = len(opps)
+        return {
+            "profit": np.fromiter((float(o.expected_profit_usd) for o in opps), dtype=np.float64, count=n),
+            "prob": np.fromiter((float(o.probability_of_profit) for o in opps), dtype=np.float64, count=n),
+            "expiry_sec": np.fromiter(
+                (o._expires_at_ts for o in opps), dtype=np.float64, count=n
+            ),
+        }
+    
     @property
     def risk_reward_ratio(self) -> Decimal:
         """Calculate risk/reward ratio"""
@@ -172,7 +336,12 @@ class ArbitrageOpportunity(BaseModel):
         return self.expected_profit_usd / self.max_risk_usd
 
 
-class Position(BaseModel):
+# Position fields that feed net_pnl
+_PNL_FIELDS = frozenset(("realized_pnl", "unrealized_pnl", "polymarket_fees", "hedge_fees"))
+
+
+@dataclass(slots=True, kw_only=True)
+class Position:
     """Active trading position"""
     position_id: str
     opportunity_id: str
@@ -199,8 +368,12 @@ class Position(BaseModel):
     take_profit_price: Optional[Decimal] = None
     max_loss_usd: Decimal
     
+    # Float mirrors of the trigger prices for per-tick comparisons
+    stop_loss_price_f: Optional[float] = None
+    take_profit_price_f: Optional[float] = None
+    
     # Timestamps
-    opened_at: datetime = Field(default_factory=datetime.utcnow)
+    opened_at: datetime = field(default_factory=datetime.utcnow)
     closed_at: Optional[datetime] = None
     expires_at: datetime
     
@@ -208,6 +381,32 @@ class Position(BaseModel):
     realized_pnl: Decimal = Decimal(0)
     unrealized_pnl: Decimal = Decimal(0)
     
+    # Abbreviated position ID for log lines
+    short_id: str = field(init=False, repr=False, compare=False)
+    _opened_at_ts: float = field(init=False, repr=False, compare=False)
+    
+    # Memoized net_pnl; cleared whenever one of _PNL_FIELDS is assigned
+    _net_pnl_cache: Optional[Decimal] = field(default=None, init=False, repr=False, compare=False)
+    
+    _DECIMAL_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "polymarket_entry_price", "polymarket_quantity", "polymarket_fees",
+        "hedge_entry_price", "hedge_quantity", "hedge_fees",
+        "stop_loss_price", "take_profit_price", "max_loss_usd",
+        "realized_pnl", "unrealized_pnl"
+    )
+    
+    def __post_init__(self):
+        _coerce_decimals(self, self._DECIMAL_FIELDS)
+        # Tail of the ID: the leading digits of time-ordered IDs are shared
+        # by every position opened within the same few seconds
+        self.short_id = self.position_id[-8:]
+        self._opened_at_ts = _posix(self.opened_at)
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name in _PNL_FIELDS:
+            object.__setattr__(self, "_net_pnl_cache", None)
+    
     @property
     def is_open(self) -> bool:
         """Check if position is currently open"""
@@ -221,23 +420,34 @@ class Position(BaseModel):
     @property
     def net_pnl(self) -> Decimal:
         """Calculate net P&L after fees"""
-        return self.realized_pnl + self.unrealized_pnl - self.total_fees
+        pnl = self._net_pnl_cache
+        if pnl is None:
+            pnl = self.realized_pnl + self.unrealized_pnl - self.total_fees
+            self._net_pnl_cache = pnl
+        return pnl
     
     @property
     def duration_hours(self) -> float:
         """Calculate position duration in hours"""
-        end_time = self.closed_at or datetime.utcnow()
+        if self.closed_at is not None:
+            return self.duration_hours_at(self.closed_at)
+        return (time.time() - self._opened_at_ts) / 3600
+    
+    def duration_hours_at(self, now: datetime) -> float:
+        """Calculate position duration in hours as of ``now``"""
+        end_time = self.closed_at or now
         delta = end_time - self.opened_at
         return delta.total_seconds() / 3600
 
 
-class TradeSignal(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TradeSignal:
     """Trading signal for execution"""
     signal_id: str
     opportunity: ArbitrageOpportunity
     action: str  # "ENTER", "EXIT", "ADJUST"
     urgency: str  # "HIGH", "MEDIUM", "LOW"
-    confidence: Decimal = Field(ge=0, le=1)
+    confidence: Decimal
     
     # Execution parameters
     max_slippage_percent: Decimal
@@ -245,58 +455,112 @@ class TradeSignal(BaseModel):
     
     # Risk checks
     risk_checks_passed: bool = False
-    risk_warnings: List[str] = Field(default_factory=list)
+    risk_warnings: List[str] = field(default_factory=list)
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=datetime.utcnow)
     expires_at: datetime
+    _expires_at_ts: float = field(init=False, repr=False, compare=False)
+    
+    _DECIMAL_FIELDS: ClassVar[Tuple[str, ...]] = ("confidence", "max_slippage_percent")
+    
+    def __post_init__(self):
+        _coerce_decimals(self, self._DECIMAL_FIELDS)
+        if not 0 <= self.confidence <= 1:
+            raise ValueError("Signal confidence must be between 0 and 1")
+        self._expires_at_ts = _posix(self.expires_at)
     
     @property
     def is_valid(self) -> bool:
         """Check if signal is still valid"""
         return (
-            datetime.utcnow() < self.expires_at 
+            time.time() < self._expires_at_ts 
             and self.risk_checks_passed
         )
 
 
 class PerformanceMetrics(BaseModel):
-    """Bot performance metrics"""
+    """
+    Bot performance metrics
+    
+    Reporting aggregates only, kept as floats; settlement math stays in
+    Decimal on Position.
+    """
     total_trades: int = 0
     winning_trades: int = 0
     losing_trades: int = 0
     
-    total_pnl: Decimal = Decimal(0)
-    best_trade: Decimal = Decimal(0)
-    worst_trade: Decimal = Decimal(0)
-    average_trade: Decimal = Decimal(0)
+    total_pnl: float = 0.0
+    best_trade: float = 0.0
+    worst_trade: float = 0.0
+    average_trade: float = 0.0
     
-    win_rate: Decimal = Decimal(0)
-    profit_factor: Decimal = Decimal(0)
-    sharpe_ratio: Decimal = Decimal(0)
-    max_drawdown: Decimal = Decimal(0)
+    win_rate: float = 0.0
+    profit_factor: float = 0.0
+    sharpe_ratio: float = 0.0
+    max_drawdown: float = 0.0
     
-    total_volume: Decimal = Decimal(0)
-    total_fees_paid: Decimal = Decimal(0)
+    total_volume: float = 0.0
+    total_fees_paid: float = 0.0
     
     start_date: datetime = Field(default_factory=datetime.utcnow)
     last_updated: datetime = Field(default_factory=datetime.utcnow)
     
+    # Ring buffer of the most recent closed-trade P&Ls for windowed statistics
+    PNL_WINDOW: ClassVar[int] = 10000
+    _pnl_buf: np.ndarray = PrivateAttr(
+        default_factory=lambda: np.empty(PerformanceMetrics.PNL_WINDOW, dtype=np.float64)
+    )
+    _pnl_n: int = PrivateAttr(default=0)
+    
+    def recent_pnls(self) -> np.ndarray:
+        """Closed-trade P&Ls in the window, oldest first"""
+        n = self._pnl_n
+        window = self.PNL_WINDOW
+        if n <= window:
+            return self._pnl_buf[:n]
+        head = n % window
+        return np.concatenate((self._pnl_buf[head:], self._pnl_buf[:head]))
+    
+    def _update_window_stats(self):
+        """Recompute profit factor, per-trade Sharpe and max drawdown over the window"""
+        pnls = self.recent_pnls()
+        
+        gross_profit = float(pnls[pnls > 0].sum())
+        gross_loss = float(-pnls[pnls < 0].sum())
+        self.profit_factor = gross_profit / gross_loss if gross_loss else 0.0
+        
+        if pnls.size > 1:
+            std = float(pnls.std(ddof=1))
+            self.sharpe_ratio = float(pnls.mean()) / std if std else 0.0
+        
+        equity = pnls.cumsum()
+        peak = np.maximum.accumulate(np.maximum(equity, 0.0))
+        self.max_drawdown = float((peak - equity).max())
+    
     def update_metrics(self, position: Position):
         """Update metrics with a closed position"""
-        self.total_trades += 1
+        pnl = float(position.net_pnl)
+        total_trades = self.total_trades + 1
+        self.total_trades = total_trades
         
-        if position.net_pnl > 0:
+        if pnl > 0:
             self.winning_trades += 1
         else:
             self.losing_trades += 1
         
-        self.total_pnl += position.net_pnl
-        self.best_trade = max(self.best_trade, position.net_pnl)
-        self.worst_trade = min(self.worst_trade, position.net_pnl)
+        self.total_pnl += pnl
+        if pnl > self.best_trade:
+            self.best_trade = pnl
+        if pnl < self.worst_trade:
+            self.worst_trade = pnl
+        
+        self.average_trade = self.total_pnl / total_trades
+        self.win_rate = self.winning_trades / total_trades
+        
+        self.total_fees_paid += float(position.total_fees)
         
-        if self.total_trades > 0:
-            self.average_trade = self.total_pnl / self.total_trades
-            self.win_rate = Decimal(self.winning_trades) / Decimal(self.total_trades)
+        self._pnl_buf[self._pnl_n % self.PNL_WINDOW] = pnl
+        self._pnl_n += 1
+        self._update_window_stats()
         
-        self.total_fees_paid += position.total_fees
         self.last_updated = datetime.utcnow()
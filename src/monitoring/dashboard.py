@@ -1,17 +1,42 @@
 """
 Real-time dashboard for monitoring bot performance
 """
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime
 from rich.layout import Layout
 from rich.panel import Panel
-from rich.table import Table
+from rich.table import Column, Table
 from rich.text import Text
 
 from src.models import ArbitrageOpportunity, Position, PerformanceMetrics
 
 
+# Column specs are built once; each table gets fresh copies (columns hold their cells)
+_OPPORTUNITY_COLUMNS = (
+    Column("Asset", style="cyan", width=6),
+    Column("Side", width=5),
+    Column("Profit", justify="right", width=8),
+    Column("Prob", justify="right", width=6),
+    Column("Expires", width=10),
+)
+_POSITION_COLUMNS = (
+    Column("ID", width=8),
+    Column("Asset", width=6),
+    Column("P&L", justify="right", width=10),
+    Column("Age", justify="right", width=8),
+)
+_METRIC_COLUMNS = (
+    Column("Metric", style="cyan"),
+    Column("Value", justify="right", style="bold"),
+)
+
+
+def _new_table(columns: Tuple[Column, ...], **kwargs) -> Table:
+    """Create a Table from prebuilt column specs"""
+    return Table(*(column.copy() for column in columns), **kwargs)
+
+
 class Dashboard:
     """Real-time performance dashboard using Rich"""
 
@@ -22,6 +47,9 @@ class Dashboard:
         self.positions: List[Position] = []
         self.metrics: Optional[PerformanceMetrics] = None
 
+        # Rendered tables keyed by a fingerprint of the data they display
+        self._cached_tables: Dict[str, Tuple[Any, Table]] = {}
+
         self._setup_layout()
 
     def _setup_layout(self):
@@ -49,6 +77,15 @@ class Dashboard:
         self.positions = positions[:5]  # Top 5 active positions
         self.metrics = metrics
 
+    def _cached_table(self, name: str, key: Any, build: Callable[[], Table]) -> Table:
+        """Return the cached table for ``name`` unless its fingerprint changed"""
+        cached = self._cached_tables.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        table = build()
+        self._cached_tables[name] = (key, table)
+        return table
+
     def get_layout(self) -> Layout:
         """Get the current dashboard layout"""
         # Header
@@ -78,25 +115,26 @@ class Dashboard:
 
     def _render_opportunities(self) -> Table:
         """Render opportunities table"""
-        table = Table(show_header=True, header_style="bold green", expand=True)
+        key = tuple((o.opportunity_id, o.expected_profit_usd) for o in self.opportunities)
+        return self._cached_table("opportunities", key, self._build_opportunities)
 
-        table.add_column("Asset", style="cyan", width=6)
-        table.add_column("Side", width=5)
-        table.add_column("Profit", justify="right", width=8)
-        table.add_column("Prob", justify="right", width=6)
-        table.add_column("Expires", width=10)
+    def _build_opportunities(self) -> Table:
+        """Build opportunities table"""
+        table = _new_table(_OPPORTUNITY_COLUMNS, show_header=True, header_style="bold green", expand=True)
 
         if not self.opportunities:
             table.add_row("No opportunities found", "", "", "", "")
             return table
 
+        # Format via float: Decimal.__format__ is several times slower
         for opp in self.opportunities:
-            profit_color = "green" if opp.expected_profit_usd > 100 else "yellow"
+            profit = float(opp.expected_profit_usd)
+            profit_color = "green" if profit > 100 else "yellow"
             table.add_row(
                 opp.polymarket.asset,
                 opp.polymarket_side.value[:4],
-                f"[{profit_color}]${opp.expected_profit_usd:.0f}[/{profit_color}]",
-                f"{opp.probability_of_profit:.0%}",
+                f"[{profit_color}]${profit:.0f}[/{profit_color}]",
+                f"{float(opp.probability_of_profit):.0%}",
                 opp.expires_at.strftime("%m/%d %H:%M")
             )
 
@@ -104,27 +142,32 @@ class Dashboard:
 
     def _render_positions(self) -> Table:
         """Render active positions table"""
-        table = Table(show_header=True, header_style="bold yellow", expand=True)
+        now = datetime.utcnow()
+        # Age is shown to 0.1h, so it only invalidates the table every six minutes
+        key = tuple(
+            (p.position_id, p.net_pnl, round(p.duration_hours_at(now), 1))
+            for p in self.positions
+        )
+        return self._cached_table("positions", key, lambda: self._build_positions(now))
 
-        table.add_column("ID", width=8)
-        table.add_column("Asset", width=6)
-        table.add_column("P&L", justify="right", width=10)
-        table.add_column("Age", justify="right", width=8)
+    def _build_positions(self, now: datetime) -> Table:
+        """Build active positions table"""
+        table = _new_table(_POSITION_COLUMNS, show_header=True, header_style="bold yellow", expand=True)
 
         if not self.positions:
             table.add_row("No active positions", "", "", "")
             return table
 
         for pos in self.positions:
-            pnl = pos.net_pnl
+            pnl = float(pos.net_pnl)
             pnl_color = "green" if pnl >= 0 else "red"
             pnl_text = f"[{pnl_color}]{'+' if pnl >= 0 else ''}${pnl:.2f}[/{pnl_color}]"
 
-            age_hours = pos.duration_hours
+            age_hours = pos.duration_hours_at(now)
             age_text = f"{age_hours:.1f}h"
 
             table.add_row(
-                pos.position_id[:8],
+                pos.short_id,
                 pos.hedge_symbol.split("-")[0],
                 pnl_text,
                 age_text
@@ -134,10 +177,16 @@ class Dashboard:
 
     def _render_metrics(self) -> Table:
         """Render performance metrics table"""
-        table = Table(show_header=False, expand=True, box=None)
+        m = self.metrics
+        key = m and (
+            m.total_trades, m.total_pnl, m.win_rate,
+            m.best_trade, m.worst_trade, m.total_fees_paid
+        )
+        return self._cached_table("metrics", key, self._build_metrics)
 
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", justify="right", style="bold")
+    def _build_metrics(self) -> Table:
+        """Build performance metrics table"""
+        table = _new_table(_METRIC_COLUMNS, show_header=False, expand=True, box=None)
 
         if not self.metrics:
             table.add_row("No data yet", "")
@@ -0,0 +1,22 @@
+"""
+Event loop setup for the arbitrage bot
+"""
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop when it is available
+
+    uvloop is not supported on Windows; there the default loop is kept.
+
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,18 +1,180 @@
 """
 Logging configuration for the arbitrage bot
 """
+import atexit
 import logging
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
-from datetime import datetime
 from rich.console import Console
 from rich.logging import RichHandler
 
+from src.utils.trade_log import TRADE_RECORD
+
 # Rich console for formatted output
 console = Console()
 
-# Global logger instance
-bot_logger = None
+# Global logger instance; handlers are attached by setup_logging()
+bot_logger = logging.getLogger("arbitrage_bot")
+
+# Background thread writing file logs, started by setup_logging()
+_log_listener: QueueListener = None
+_SETUP_DONE = False
+
+
+class _BufferedFileMixin:
+    """
+    Large write buffer for file handlers
+
+    StreamHandler flushes after every record; this only flushes once
+    FLUSH_INTERVAL has passed since the last flush, on ERROR and above, and on
+    close (including rollover), so bursts of records coalesce into few write
+    syscalls. While no records arrive, _FlushingQueueListener calls
+    flush_buffer() every FLUSH_INTERVAL so quiet periods are not held back.
+    """
+
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL = 1.0
+    _last_flush = 0.0
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+
+    def flush(self):
+        now = time.monotonic()
+        if now - self._last_flush >= self.FLUSH_INTERVAL:
+            self._last_flush = now
+            super().flush()
+
+    def flush_buffer(self):
+        """Flush regardless of when the last flush happened"""
+        self._last_flush = time.monotonic()
+        super().flush()
+
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.flush_buffer()
+
+    def close(self):
+        super().flush()
+        super().close()
+
+
+class BufferedFileHandler(_BufferedFileMixin, TimedRotatingFileHandler):
+    """Buffered text log, rotated at UTC midnight"""
+
+
+class BinaryTradeHandler(_BufferedFileMixin, RotatingFileHandler):
+    """
+    Size-rotated trade log sink writing compact binary records
+
+    Records are TRADE_RECORD headers plus the UTF-8 message, skipping the
+    text formatter entirely; src.utils.trade_log converts them back to text.
+    """
+
+    def __init__(self, filename, max_bytes: int = 0, backup_count: int = 0, delay: bool = False):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+        # RotatingFileHandler forces text append mode when maxBytes is set
+        self.mode = "ab"
+        self.encoding = None
+        self.errors = None
+        self.delay = delay
+        if not delay:
+            self.stream = self._open()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            message = record.getMessage().encode("utf-8")
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes and self.stream.tell() + TRADE_RECORD.size + len(message) > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(TRADE_RECORD.pack(record.created, record.levelno, len(message)))
+            self.stream.write(message)
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp once and reuses it"""
+
+    def __init__(self, fmt: str = None, datefmt: str = "%Y-%m-%d %H:%M:%S"):
+        super().__init__(fmt, datefmt)
+        # (epoch second, formatted string); swapped as one tuple so readers never see a torn pair
+        self._cached_time = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        sec = int(record.created)
+        cached_sec, cached_str = self._cached_time
+        if sec != cached_sec:
+            cached_str = time.strftime(datefmt or self.datefmt, self.converter(sec))
+            self._cached_time = (sec, cached_str)
+        return cached_str
+
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for an in-process listener
+
+    Only the message is rendered on the calling thread (so later mutation of
+    the args cannot change it); exc_info is kept so Rich can still render
+    tracebacks, and traceback formatting itself moves to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes buffered file handlers whenever the queue stays idle"""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self.queue.get(block, timeout=_BufferedFileMixin.FLUSH_INTERVAL)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    if isinstance(handler, _BufferedFileMixin):
+                        handler.acquire()
+                        try:
+                            handler.flush_buffer()
+                        finally:
+                            handler.release()
+
+
+class _TradeFilter(logging.Filter):
+    """Pass only records logged with extra={'trade': True}"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.__dict__.get("trade", False)
+
+
+_trade_filter = _TradeFilter()
+
+
+def stop_logging():
+    """Flush queued file records and stop the background log writer"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 def setup_logging(level: str = "INFO", environment: str = "development"):
@@ -23,7 +185,11 @@ def setup_logging(level: str = "INFO", environment: str = "development"):
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         environment: Environment name (development, production)
     """
-    global bot_logger
+    global _log_listener, _SETUP_DONE
+
+    # Handlers are only built once; later calls reuse them
+    if _SETUP_DONE:
+        return bot_logger
 
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
@@ -32,11 +198,8 @@ def setup_logging(level: str = "INFO", environment: str = "development"):
     # Configure logging level
     log_level = getattr(logging, level.upper(), logging.INFO)
 
-    # Create logger
-    bot_logger = logging.getLogger("arbitrage_bot")
+    # Configure logger
     bot_logger.setLevel(log_level)
-
-    # Clear existing handlers
     bot_logger.handlers.clear()
 
     # Console handler with Rich formatting
@@ -45,49 +208,58 @@ def setup_logging(level: str = "INFO", environment: str = "development"):
         show_time=True,
         show_path=False,
         markup=True,
-        rich_tracebacks=True,
+        rich_tracebacks=environment == "development",
         tracebacks_show_locals=environment == "development"
     )
-    console_handler.setLevel(log_level)
+    # Outside development, DEBUG never reaches Rich (the file log still gets it)
+    console_level = log_level if environment == "development" else max(log_level, logging.INFO)
+    console_handler.setLevel(console_level)
 
-    # File handler for persistent logs
-    log_file = log_dir / f"bot_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file)
+    # File handler for persistent logs; rotated daily, two weeks kept
+    file_handler = BufferedFileHandler(
+        log_dir / "bot.log",
+        when="midnight",
+        utc=True,
+        backupCount=14,
+        encoding="utf-8"
+    )
     file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
 
     # Format for file logs
-    file_formatter = logging.Formatter(
+    file_formatter = CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
 
-    # Add handlers
-    bot_logger.addHandler(console_handler)
-    bot_logger.addHandler(file_handler)
-
-    # Separate file for trade logs
-    trade_log_file = log_dir / f"trades_{datetime.now().strftime('%Y%m%d')}.log"
-    trade_handler = logging.FileHandler(trade_log_file)
+    # Separate binary file for trade logs (inflate with python -m src.utils.trade_log)
+    trade_handler = BinaryTradeHandler(
+        log_dir / "trades.bin",
+        max_bytes=64 * 1024 * 1024,
+        backup_count=20
+    )
     trade_handler.setLevel(logging.INFO)
-    trade_handler.setFormatter(file_formatter)
 
-    # Filter to only log messages with extra={'trade': True}
-    class TradeFilter(logging.Filter):
-        def filter(self, record):
-            return hasattr(record, 'trade') and record.trade
+    # Only log messages with extra={'trade': True}
+    trade_handler.addFilter(_trade_filter)
 
-    trade_handler.addFilter(TradeFilter())
-    bot_logger.addHandler(trade_handler)
+    # All output happens on a listener thread so the event loop never blocks on disk or tty
+    log_queue = queue.SimpleQueue()
+    bot_logger.addHandler(_LocalQueueHandler(log_queue))
+    _log_listener = _FlushingQueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        trade_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(stop_logging)
 
     # Prevent propagation to root logger
     bot_logger.propagate = False
 
-    bot_logger.info(f"Logging initialized - Level: {level}, Environment: {environment}")
+    _SETUP_DONE = True
+    bot_logger.info("Logging initialized - Level: %s, Environment: %s", level, environment)
 
     return bot_logger
-
-
-# Initialize with default settings if imported directly
-if bot_logger is None:
-    bot_logger = setup_logging()
@@ -2,75 +2,252 @@
 Notification manager for alerts and updates
 """
 import asyncio
-from typing import Optional, List
-from datetime import datetime
+import time
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 import aiohttp
+import orjson
 
 from src.models import Position, ArbitrageOpportunity
 from src.config import config
 from src.utils.logger import bot_logger
 
 
+# Separator between coalesced messages in one Telegram send
+_BATCH_SEPARATOR = "\n\n---\n\n"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+# Indexed by a bool: [loss, gain] and [non-critical, critical]
+_PNL_EMOJI = ("🔴", "🟢")
+_PNL_SIGN = ("-", "+")
+_ERROR_STYLE = (("⚠️", "ERROR"), ("🚨", "CRITICAL ERROR"))
+
+# strftime format -> (epoch second, formatted UTC string)
+_utc_stamps: Dict[str, Tuple[int, str]] = {}
+
+
+def _utc_stamp(fmt: str) -> str:
+    """Current UTC time formatted with ``fmt``, rendered at most once per second"""
+    sec = int(time.time())
+    cached = _utc_stamps.get(fmt)
+    if cached is None or cached[0] != sec:
+        cached = (sec, time.strftime(fmt, time.gmtime(sec)))
+        _utc_stamps[fmt] = cached
+    return cached[1]
+
+
 class NotificationManager:
     """Manages notifications and alerts"""
     
+    __slots__ = (
+        "telegram_enabled",
+        "telegram_token",
+        "telegram_chat_id",
+        "_send_url",
+        "_session",
+        "_queue",
+        "_sender",
+    )
+    
+    QUEUE_SIZE = 10_000
+    MAX_BATCH_CHARS = 3500  # Telegram caps a message at 4096 characters
+    MIN_SEND_INTERVAL = 1.0  # Telegram's per-chat limit is about one message per second
+    FLUSH_TIMEOUT = 5.0  # Seconds close() waits for queued messages to go out
+    SEND_RETRIES = 4  # Retries after the first attempt (5 attempts total)
+    
     def __init__(self):
         """Initialize notification manager"""
         self.telegram_enabled = config.ENABLE_TELEGRAM_ALERTS
         self.telegram_token = config.TELEGRAM_BOT_TOKEN
         self.telegram_chat_id = config.TELEGRAM_CHAT_ID
         
+        # Long-lived keep-alive session; created by start() or on first send
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # (message, parse_mode) pairs drained by a single background sender
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._sender: Optional[asyncio.Task] = None
+        
         if self.telegram_enabled:
             if not self.telegram_token or not self.telegram_chat_id:
                 bot_logger.warning("Telegram alerts enabled but credentials missing")
                 self.telegram_enabled = False
             else:
                 bot_logger.info("Telegram notifications enabled")
+        
+        # Built once; only needed when alerts survive the credential check
+        self._send_url: Optional[str] = (
+            f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
+            if self.telegram_enabled else None
+        )
+    
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Create a keep-alive session reused by every Telegram call"""
+        connector = aiohttp.TCPConnector(
+            limit=10,
+            keepalive_timeout=75,
+            ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    
+    async def start(self):
+        """Open the shared HTTP session and start the background sender"""
+        if not self.telegram_enabled:
+            return
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(self._drain())
+    
+    async def close(self):
+        """Flush queued messages, then stop the sender and close the session"""
+        if self._sender:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                bot_logger.warning("Dropping %d unsent Telegram messages", self._queue.qsize())
+            self._sender.cancel()
+            await asyncio.gather(self._sender, return_exceptions=True)
+            self._sender = None
+        
+        if self._session:
+            await self._session.close()
+            self._session = None
     
     async def send_telegram_message(self, message: str, parse_mode: str = "Markdown") -> bool:
         """
-        Send a message via Telegram
+        Queue a message for delivery via Telegram
+        
+        Returns immediately; the background sender coalesces queued messages
+        and paces the actual API calls.
         
         Args:
             message: Message text
             parse_mode: Telegram parse mode (Markdown or HTML)
         
         Returns:
-            Success status
+            Whether the message was queued
         """
         if not self.telegram_enabled:
             return False
         
+        if self._sender is None or self._sender.done():
+            await self.start()
+        
         try:
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
+            self._queue.put_nowait((message, parse_mode))
+            return True
+        except asyncio.QueueFull:
+            bot_logger.warning("Telegram queue full, dropping message")
+            return False
+    
+    async def _drain(self):
+        """Send queued messages, merging consecutive ones into a single API call"""
+        queue = self._queue
+        carry = None
+        
+        while True:
+            message, parse_mode = carry or await queue.get()
+            carry = None
+            parts = [message]
+            size = len(message)
             
-            payload = {
-                "chat_id": self.telegram_chat_id,
-                "text": message,
-                "parse_mode": parse_mode,
-                "disable_web_page_preview": True
-            }
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item[1] != parse_mode or size + len(_BATCH_SEPARATOR) + len(item[0]) > self.MAX_BATCH_CHARS:
+                    carry = item
+                    break
+                parts.append(item[0])
+                size += len(_BATCH_SEPARATOR) + len(item[0])
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as response:
+            try:
+                status = await self._post(_BATCH_SEPARATOR.join(parts), parse_mode)
+                if status == 400 and len(parts) > 1:
+                    # One malformed alert (e.g. unbalanced Markdown) rejects
+                    # the whole batch; resend separately so only it is lost
+                    bot_logger.warning("Telegram rejected a batch of %d messages, resending individually", len(parts))
+                    for part in parts:
+                        await asyncio.sleep(self.MIN_SEND_INTERVAL)
+                        await self._post(part, parse_mode)
+            except Exception as e:
+                # The sender must outlive any single failed send
+                bot_logger.error("Error sending Telegram batch: %s", e)
+            finally:
+                for _ in parts:
+                    queue.task_done()
+            
+            await asyncio.sleep(self.MIN_SEND_INTERVAL)
+    
+    async def _post(self, message: str, parse_mode: str) -> Optional[int]:
+        """
+        Send one message via the Telegram Bot API
+        
+        HTTP 429 responses wait for the server's Retry-After; 5xx responses,
+        connection errors and timeouts are retried with exponential backoff.
+        
+        Args:
+            message: Message text
+            parse_mode: Telegram parse mode (Markdown or HTML)
+        
+        Returns:
+            Final HTTP status (200 on success), or None if no response arrived
+        """
+        payload = orjson.dumps({
+            "chat_id": self.telegram_chat_id,
+            "text": message,
+            "parse_mode": parse_mode,
+            "disable_web_page_preview": True
+        })
+        
+        for attempt in range(self.SEND_RETRIES + 1):
+            try:
+                async with self._session.post(self._send_url, data=payload, headers=_JSON_HEADERS) as response:
                     if response.status == 200:
                         bot_logger.debug("Telegram message sent successfully")
-                        return True
-                    else:
+                        return response.status
+                    
+                    retryable = response.status == 429 or response.status >= 500
+                    if not retryable or attempt == self.SEND_RETRIES:
                         error_text = await response.text()
-                        bot_logger.error(f"Failed to send Telegram message: {error_text}")
-                        return False
+                        bot_logger.error("Failed to send Telegram message: %s", error_text)
+                        return response.status
+                    
+                    retry_after = response.headers.get("Retry-After", "")
+                    if response.status == 429 and retry_after.isdigit():
+                        delay = float(retry_after)
+                    else:
+                        delay = 0.25 * 2 ** attempt
                         
-        except Exception as e:
-            bot_logger.error(f"Error sending Telegram message: {e}")
-            return False
+            except _TRANSIENT_ERRORS as e:
+                if attempt == self.SEND_RETRIES:
+                    bot_logger.error("Error sending Telegram message: %s", e)
+                    return None
+                delay = 0.25 * 2 ** attempt
+            except Exception as e:
+                # Anything else is not worth retrying, and must not kill the sender task
+                bot_logger.error("Error sending Telegram message: %s", e)
+                return None
+            
+            bot_logger.debug("Telegram send attempt %d failed, retrying in %.2fs", attempt + 1, delay)
+            await asyncio.sleep(delay)
+        
+        return None
     
     async def send_startup_alert(self):
         """Send bot startup notification"""
+        if not self.telegram_enabled:
+            return
+        
         message = (
             "🤖 *Polymarket Arbitrage Bot Started*\n\n"
-            f"⏰ Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC\n"
+            f"⏰ Time: {_utc_stamp('%Y-%m-%d %H:%M:%S')} UTC\n"
             f"💰 Mode: {'Live Trading' if config.ENVIRONMENT == 'production' else 'Paper Trading'}\n"
             f"📊 Max Position: ${config.MAX_POSITION_SIZE_USD}\n"
             f"🎯 Min Profit: ${config.MIN_PROFIT_THRESHOLD_USD}\n"
@@ -81,14 +258,17 @@ class NotificationManager:
     
     async def send_opportunity_alert(self, opportunity: ArbitrageOpportunity):
         """Send notification about a profitable opportunity"""
+        if not self.telegram_enabled:
+            return
+        
         message = (
             "💡 *New Arbitrage Opportunity*\n\n"
             f"🪙 Asset: {opportunity.polymarket.asset}\n"
-            f"📈 Polymarket: {opportunity.polymarket_side.value} @ {opportunity.polymarket_price:.4f}\n"
-            f"🔄 Hedge: {opportunity.hedge_side.value} @ ${opportunity.hedge_price:.2f}\n"
-            f"💵 Expected Profit: ${opportunity.expected_profit_usd:.2f} "
-            f"({opportunity.expected_profit_percentage:.1f}%)\n"
-            f"📊 Probability: {opportunity.probability_of_profit:.1%}\n"
+            f"📈 Polymarket: {opportunity.polymarket_side.value} @ {float(opportunity.polymarket_price):.4f}\n"
+            f"🔄 Hedge: {opportunity.hedge_side.value} @ ${float(opportunity.hedge_price):.2f}\n"
+            f"💵 Expected Profit: ${float(opportunity.expected_profit_usd):.2f} "
+            f"({float(opportunity.expected_profit_percentage):.1f}%)\n"
+            f"📊 Probability: {float(opportunity.probability_of_profit):.1%}\n"
             f"⏱️ Expires: {opportunity.expires_at.strftime('%H:%M')} UTC\n"
         )
         
@@ -96,42 +276,53 @@ class NotificationManager:
     
     async def send_trade_alert(self, position: Position):
         """Send notification about executed trade"""
+        if not self.telegram_enabled:
+            return
+        
         message = (
             "✅ *Trade Executed*\n\n"
-            f"🆔 Position: `{position.position_id[:8]}`\n"
+            f"🆔 Position: `{position.short_id}`\n"
             f"🪙 Symbol: {position.hedge_symbol}\n"
             f"📈 Polymarket: {position.polymarket_side.value} "
-            f"{position.polymarket_quantity:.2f} @ {position.polymarket_entry_price:.4f}\n"
+            f"{float(position.polymarket_quantity):.2f} @ {float(position.polymarket_entry_price):.4f}\n"
             f"🔄 Hedge: {position.hedge_side.value} "
-            f"{position.hedge_quantity:.4f} @ ${position.hedge_entry_price:.2f}\n"
-            f"🛑 Stop Loss: ${position.stop_loss_price:.2f}\n"
-            f"🎯 Take Profit: ${position.take_profit_price:.2f}\n"
-            f"⚠️ Max Risk: ${position.max_loss_usd:.2f}\n"
+            f"{float(position.hedge_quantity):.4f} @ ${float(position.hedge_entry_price):.2f}\n"
+            f"🛑 Stop Loss: ${float(position.stop_loss_price):.2f}\n"
+            f"🎯 Take Profit: ${float(position.take_profit_price):.2f}\n"
+            f"⚠️ Max Risk: ${float(position.max_loss_usd):.2f}\n"
         )
         
         await self.send_telegram_message(message)
     
     async def send_position_closed_alert(self, position: Position, reason: str):
         """Send notification when position is closed"""
-        pnl_emoji = "🟢" if position.net_pnl >= 0 else "🔴"
-        pnl_text = f"+${position.net_pnl:.2f}" if position.net_pnl >= 0 else f"-${abs(position.net_pnl):.2f}"
+        if not self.telegram_enabled:
+            return
+        
+        pnl = float(position.net_pnl)
+        gain = pnl >= 0
+        pnl_emoji = _PNL_EMOJI[gain]
+        pnl_text = f"{_PNL_SIGN[gain]}${abs(pnl):.2f}"
         
         message = (
             f"{pnl_emoji} *Position Closed*\n\n"
-            f"🆔 Position: `{position.position_id[:8]}`\n"
+            f"🆔 Position: `{position.short_id}`\n"
             f"📊 Reason: {reason}\n"
             f"💰 Net P&L: {pnl_text}\n"
             f"⏱️ Duration: {position.duration_hours:.1f} hours\n"
-            f"💸 Fees Paid: ${position.total_fees:.2f}\n"
+            f"💸 Fees Paid: ${float(position.total_fees):.2f}\n"
         )
         
         await self.send_telegram_message(message)
     
     async def send_daily_summary(self, metrics: dict):
         """Send daily performance summary"""
+        if not self.telegram_enabled:
+            return
+        
         message = (
             "📊 *Daily Performance Summary*\n\n"
-            f"📅 Date: {datetime.utcnow().strftime('%Y-%m-%d')}\n"
+            f"📅 Date: {_utc_stamp('%Y-%m-%d')}\n"
             f"━━━━━━━━━━━━━━━━━\n"
             f"📈 Total Trades: {metrics.get('total_trades', 0)}\n"
             f"✅ Winning: {metrics.get('winning_trades', 0)}\n"
@@ -149,38 +340,44 @@ class NotificationManager:
     
     async def send_error_alert(self, error_message: str, critical: bool = False):
         """Send error notification"""
-        emoji = "🚨" if critical else "⚠️"
-        level = "CRITICAL ERROR" if critical else "ERROR"
+        if not self.telegram_enabled:
+            return
+        
+        emoji, level = _ERROR_STYLE[bool(critical)]
         
         message = (
             f"{emoji} *{level}*\n\n"
             f"❌ Error: {error_message}\n"
-            f"⏰ Time: {datetime.utcnow().strftime('%H:%M:%S')} UTC\n"
+            f"⏰ Time: {_utc_stamp('%H:%M:%S')} UTC\n"
         )
         
         await self.send_telegram_message(message)
     
     async def send_balance_alert(self, balances: dict):
         """Send low balance alert"""
+        if not self.telegram_enabled:
+            return
+        
         total = sum(balances.values())
         
+        lines = "\n".join(f"• {asset}: ${balance:.2f}" for asset, balance in balances.items())
         message = (
             "⚠️ *Low Balance Warning*\n\n"
             f"💰 Total Balance: ${total:.2f}\n"
+            f"{lines}\n"
+            "\n⚡ Please add funds to continue trading"
         )
         
-        for asset, balance in balances.items():
-            message += f"• {asset}: ${balance:.2f}\n"
-        
-        message += "\n⚡ Please add funds to continue trading"
-        
         await self.send_telegram_message(message)
     
     async def send_shutdown_alert(self, final_metrics: dict):
         """Send bot shutdown notification"""
+        if not self.telegram_enabled:
+            return
+        
         message = (
             "🛑 *Bot Shutdown*\n\n"
-            f"⏰ Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC\n"
+            f"⏰ Time: {_utc_stamp('%Y-%m-%d %H:%M:%S')} UTC\n"
             f"━━━━━━━━━━━━━━━━━\n"
             f"📊 Final Statistics:\n"
             f"• Total Trades: {final_metrics.get('total_trades', 0)}\n"
@@ -0,0 +1,59 @@
+"""
+Binary trade log format and offline reader
+
+Each record is a TRADE_RECORD header (created timestamp, level number,
+message length) followed by the UTF-8 message bytes. Convert a log back to
+text with:
+
+    python -m src.utils.trade_log logs/trades.bin
+"""
+import logging
+import struct
+import sys
+import time
+from typing import BinaryIO, Iterator, Tuple
+
+# created (float64), levelno (uint8), message length (uint32); little-endian
+TRADE_RECORD = struct.Struct("<dBI")
+
+
+def read_trade_log(stream: BinaryIO) -> Iterator[Tuple[float, int, str]]:
+    """
+    Iterate over the records of a binary trade log
+
+    Args:
+        stream: Binary file object positioned at a record boundary
+
+    Returns:
+        Iterator of (created, levelno, message) tuples; a truncated final
+        record is ignored
+    """
+    header_size = TRADE_RECORD.size
+    while True:
+        header = stream.read(header_size)
+        if len(header) < header_size:
+            return
+        created, levelno, length = TRADE_RECORD.unpack(header)
+        message = stream.read(length)
+        if len(message) < length:
+            return
+        yield created, levelno, message.decode("utf-8")
+
+
+def inflate(path: str, out=sys.stdout):
+    """
+    Write a binary trade log as text lines in the file log format
+
+    Args:
+        path: Path to the binary trade log
+        out: Text stream to write to
+    """
+    with open(path, "rb") as stream:
+        for created, levelno, message in read_trade_log(stream):
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+            out.write(f"{timestamp} - arbitrage_bot - {logging.getLevelName(levelno)} - {message}\n")
+
+
+if __name__ == "__main__":
+    for log_path in sys.argv[1:]:
+        inflate(log_path)